@@ -20,22 +20,83 @@
 # Run from repo root:
 #   ruby 00_impact_scan.rb
 
+require "find"
+require "json"
+
 SEARCH_DIRS = %w[rust/src rust/crates rust/xtask rust/tests rust/examples]
 
 RENAME_RISK_TERMS = %w[product-service-taxonomy ob-poc.product-service-taxonomy]
 NEW_ID_TERMS = %w[platform-admin ob-poc.platform-admin]
 STRUCTURAL_FIELD_TERMS = %w[dsl_verb_reconciliation owned_entity_kinds owned_packs allowed_verbs]
 
-def rg(term, dirs)
+# One ripgrep pass for every term: rg compiles the fixed strings into a
+# single multi-literal matcher, so the tree is walked once instead of once
+# per term. Output is consumed event by event as rg produces it and each
+# matched line is attributed to every term its text contains, which gives
+# the same per-term line sets as running `rg -F term` separately
+# (including lines that contain several terms).
+#
+# Returns [hits, counts]: full `path:line:text` hit lists for list_terms,
+# and only matching-line counts for count_terms, whose section reports
+# nothing but a number (so no hit strings are built or kept for them).
+def rg_all(list_terms, count_terms, dirs)
+  hits = list_terms.to_h { |t| [t, []] }
+  counts = count_terms.to_h { |t| [t, 0] }
+  terms = (list_terms + count_terms).uniq
   dirs = dirs.select { |d| Dir.exist?(d) }
-  return [] if dirs.empty?
-  out = IO.popen(["rg", "-n", "--no-heading", "-F", term, *dirs], err: [:child, :out]) { |io| io.read }
-  out.lines.map(&:chomp)
+  return [hits, counts] if dirs.empty? || terms.empty?
+  record = lambda do |path, line_no, text|
+    count_terms.each { |t| counts[t] += 1 if text.include?(t) }
+    listed = list_terms.select { |t| text.include?(t) }
+    next if listed.empty?
+    hit = "#{path}:#{line_no}:#{text}"
+    listed.each { |t| hits[t] << hit }
+  end
+  patterns = terms.flat_map { |t| ["-e", t] }
+  # --json gives path, line number and line text as separate fields, so
+  # paths containing ':' can't be mis-split and only the line text is
+  # ever matched against the terms.
+  IO.popen(["rg", "--json", "-F", *patterns, *dirs], external_encoding: Encoding::UTF_8) do |io|
+    io.each_line do |event|
+      event = JSON.parse(event.scrub)
+      next unless event["type"] == "match"
+      data = event["data"]
+      record.call(data.dig("path", "text"), data["line_number"], data.dig("lines", "text").to_s.chomp)
+    end
+  end
+  [hits, counts]
 rescue Errno::ENOENT
-  warn "ripgrep (rg) not found on PATH — install it, or swap `rg -n --no-heading -F` for `grep -rn -F` below."
-  []
+  warn "ripgrep (rg) not found on PATH — falling back to a slower in-process scan."
+  scan_in_process(terms, dirs, &record)
+  [hits, counts]
 end
 
+# Fallback for machines without rg: each file is read once and tested
+# against a single alternation of every term (Regexp.union), so the cost
+# stays one pass over the tree however many terms there are; only lines
+# that match are handed on for per-term attribution. Build output and
+# vendored trees are pruned, and files with NUL bytes are skipped as
+# binary, roughly as rg would.
+def scan_in_process(terms, dirs)
+  any_term = Regexp.union(terms)
+  dirs.each do |dir|
+    Find.find(dir) do |path|
+      if File.directory?(path)
+        Find.prune if %w[target node_modules .git].include?(File.basename(path))
+        next
+      end
+      next unless File.file?(path)
+      data = File.binread(path)
+      next if data.include?("\0") || !data.match?(any_term)
+      data.force_encoding(Encoding::UTF_8).scrub.each_line.with_index(1) do |line, line_no|
+        yield path, line_no, line.chomp if line.match?(any_term)
+      end
+    end
+  end
+end
+
+HITS, COUNTS = rg_all(RENAME_RISK_TERMS + NEW_ID_TERMS, STRUCTURAL_FIELD_TERMS, SEARCH_DIRS)
+
 puts "=" * 72
 puts "IMPACT SCAN — hardcoded reference check"
 puts "=" * 72
@@ -46,7 +107,7 @@ puts "OLD id — the rename step only touches 2 files (the journey-pack yaml"
 puts "and the domain-pack manifest). Anything found here needs a manual fix."
 any = false
 RENAME_RISK_TERMS.each do |term|
-  hits = rg(term, SEARCH_DIRS)
+  hits = HITS[term]
   next if hits.empty?
   any = true
   puts "\n  term: #{term.inspect}  (#{hits.size} hit(s))"
@@ -57,7 +118,7 @@ puts "\n  -> CLEAN: no source-code references found." unless any
 puts "\n## 2. NEW-ID COLLISION CHECK: platform-admin"
 any = false
 NEW_ID_TERMS.each do |term|
-  hits = rg(term, SEARCH_DIRS)
+  hits = HITS[term]
   next if hits.empty?
   any = true
   puts "\n  term: #{term.inspect}  (#{hits.size} hit(s)) — investigate before using this id"
@@ -72,8 +133,7 @@ puts "0 hits for allowed_verbs), pack admission may be enforced somewhere"
 puts "this scan didn't catch — grep manually before trusting that the"
 puts "remediation's pack-admission changes have real runtime effect."
 STRUCTURAL_FIELD_TERMS.each do |term|
-  hits = rg(term, SEARCH_DIRS)
-  puts "  #{term}: #{hits.size} reference(s) in source"
+  puts "  #{term}: #{COUNTS[term]} reference(s) in source"
 end
 
 puts "\n## 4. VERB FQN SPOT-CHECK"
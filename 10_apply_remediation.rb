@@ -94,11 +94,11 @@ end
 # Insert missing items into a YAML block-sequence found by descending
 # key_path (array of key names) from the top of the file. Creates the
 # tail of the path as a new nested block if it doesn't fully exist yet.
-# Returns the list of items actually added (empty if all already present
-# or if dry-run).
-def patch_yaml_sequence(path, key_path, new_items)
+# Patches `lines` (File.readlines of path) in place and returns the list
+# of items actually added (empty if all already present). Writing the
+# file back is the caller's job — see flush_sequence_patches.
+def patch_yaml_sequence!(lines, path, key_path, new_items)
   return [] if new_items.empty?
-  lines = File.readlines(path)
 
   key_line_idx = nil
   indent = -2
@@ -137,7 +137,7 @@ def patch_yaml_sequence(path, key_path, new_items)
 
   if found_depth == key_path.size
     seq_indent = indent + 2
-    existing = []
+    existing = Set.new
     end_idx = key_line_idx + 1
     while end_idx < lines.size
       line = lines[end_idx]
@@ -159,7 +159,7 @@ def patch_yaml_sequence(path, key_path, new_items)
     missing = new_items.reject { |it| existing.include?(it) }.uniq
     return [] if missing.empty?
     insertion = missing.sort.map { |it| "#{' ' * seq_indent}- #{it}\n" }
-    lines = lines[0...end_idx] + insertion + lines[end_idx..-1]
+    lines.insert(end_idx, *insertion)
   else
     parent_indent = indent
     child_indent = parent_indent + 2
@@ -180,22 +180,52 @@ def patch_yaml_sequence(path, key_path, new_items)
     remaining.each { |k| block << "#{' ' * cur_indent}#{k}:\n"; cur_indent += 2 }
     new_items.sort.each { |it| block << "#{' ' * cur_indent}- #{it}\n" }
     missing = new_items.dup
-    lines = lines[0...end_idx] + block + lines[end_idx..-1]
+    lines.insert(end_idx, *block)
   end
 
-  File.write(path, lines.join) if APPLY
   missing
 end
 
-# Remove a single "- value" line from a block found under key_path.
+# Tracks A and B admit verbs one at a time, often dozens into the same
+# pack or DAG file. Queue them here instead of patching immediately, then
+# flush_sequence_patches reads and writes each file once with every
+# queued item applied in queue order (so the result is the same as
+# patching one item at a time). Each queued item carries the CHANGE_LOG
+# entry to record if it turns out to be genuinely new.
+PENDING_SEQUENCE_ITEMS = [] # [path, key_path, item, category, desc]
+
+def queue_sequence_item(path, key_path, item, category, desc)
+  PENDING_SEQUENCE_ITEMS << [path, key_path, item, category, desc]
+end
+
+def flush_sequence_patches
+  entries = []
+  PENDING_SEQUENCE_ITEMS.each_with_index.group_by { |(path, *), _| path }.each do |path, queued|
+    lines = File.readlines(path)
+    changed = false
+    queued.each do |(_, key_path, item, category, desc), idx|
+      next if patch_yaml_sequence!(lines, path, key_path, [item]).empty?
+      changed = true
+      entries << [idx, category, path, desc]
+    end
+    File.write(path, lines.join) if APPLY && changed
+  end
+  entries.sort_by(&:first).each { |_, category, path, desc| log(category, path, desc) }
+  PENDING_SEQUENCE_ITEMS.clear
+end
+
+# Remove every "- value" line for the given values from a block found
+# under key_path, in one read and (at most) one write of the file rather
+# than one per value. Returns the values actually removed, in input order.
 # If the block becomes empty, collapses "key:\n" to "key: []\n" rather
 # than leaving a dangling key with nothing under it (parses as YAML null,
 # not an empty sequence — harmless to the one known reader today, since
 # sem_os_obpoc_adapter's string_vec() treats non-sequence as empty, but
 # ambiguous YAML worth avoiding on principle).
-def remove_yaml_sequence_item(path, key_path, value)
+def remove_yaml_sequence_items(path, key_path, values)
+  targets = values.to_h { |v| ["- #{v}", v] }
   lines = File.readlines(path)
-  removed = false
+  removed = Set.new
   target_key = key_path.last
   in_block = false
   block_indent = nil
@@ -222,19 +252,19 @@ def remove_yaml_sequence_item(path, key_path, value)
         new_lines << line
         next
       end
-      if stripped == "- #{value}"
-        removed = true
+      if (value = targets[stripped])
+        removed << value
         next # drop this line
       end
       items_kept += 1
     end
     new_lines << line
   end
-  if removed && items_kept.zero?
+  if removed.any? && items_kept.zero?
     new_lines[key_line_idx] = "#{' ' * block_indent}#{target_key}: []\n"
   end
-  File.write(path, new_lines.join) if APPLY && removed
-  removed
+  File.write(path, new_lines.join) if APPLY && removed.any?
+  values.uniq.select { |v| removed.include?(v) }
 end
 
 def log(category, path, desc)
@@ -272,20 +302,16 @@ ENTITY_KIND_CLEANUP.each do |pack_id, kinds|
   next unless sample_gate("entity_kind_cleanup", seen_categories)
   dp = domain_packs[pack_id]
   next unless dp
-  kinds.each do |k|
-    removed = remove_yaml_sequence_item(dp[:file], %w[owned_entity_kinds], k)
-    if removed
-      log("manifest-cleanup", dp[:file], "removed false owned_entity_kinds claim: #{k}")
-    end
+  remove_yaml_sequence_items(dp[:file], %w[owned_entity_kinds], kinds).each do |k|
+    log("manifest-cleanup", dp[:file], "removed false owned_entity_kinds claim: #{k}")
   end
 end
 OWNED_PACKS_CLEANUP.each do |pack_id, jps|
   next unless sample_gate("owned_packs_cleanup", seen_categories)
   dp = domain_packs[pack_id]
   next unless dp
-  jps.each do |jp|
-    removed = remove_yaml_sequence_item(dp[:file], %w[owned_packs], jp)
-    log("manifest-cleanup", dp[:file], "removed duplicate owned_packs claim: #{jp}") if removed
+  remove_yaml_sequence_items(dp[:file], %w[owned_packs], jps).each do |jp|
+    log("manifest-cleanup", dp[:file], "removed duplicate owned_packs claim: #{jp}")
   end
 end
 
@@ -647,14 +673,13 @@ verbs.sort.each do |fqn, v|
   next if jp[:allowed_verbs].include?(fqn) # already admitted — nothing to do here
   next unless sample_gate("track_b_#{jp_id}", seen_categories)
 
-  added = patch_yaml_sequence(jp[:file], %w[allowed_verbs], [fqn])
-  log("track-b-pack", jp[:file], "admitted #{fqn}") unless added.empty?
+  queue_sequence_item(jp[:file], %w[allowed_verbs], fqn, "track-b-pack", "admitted #{fqn}")
 
   target_dag = primary_dag_for_journey_pack(jp_id, jpack_owner, domain_packs)
   if target_dag && dags[target_dag]
     surface = "#{domain.tr('-', '_').tr('.', '_')}_surface"
-    added2 = patch_yaml_sequence(dags[target_dag][:file], ["dsl_verb_reconciliation", surface], [fqn])
-    log("track-b-dag", dags[target_dag][:file], "reconciled #{fqn} under #{surface}") unless added2.empty?
+    queue_sequence_item(dags[target_dag][:file], ["dsl_verb_reconciliation", surface], fqn,
+                        "track-b-dag", "reconciled #{fqn} under #{surface}")
   end
 end
 
@@ -669,15 +694,16 @@ verbs.sort.each do |fqn, v|
     next unless target_dag && dags[target_dag]
     # session_bootstrap_dag.yaml has no dsl_verb_reconciliation block by
     # design (see section 3 note) — leave it untouched this pass, same as
-    # Track B. patch_yaml_sequence can extend an existing key path's tail
+    # Track B. patch_yaml_sequence! can extend an existing key path's tail
     # but can't fabricate a brand-new top-level key, so this would
     # otherwise crash.
     next if target_dag == "session_bootstrap_dag"
     surface = "#{domain.tr('-', '_').tr('.', '_')}_surface"
-    added = patch_yaml_sequence(dags[target_dag][:file], ["dsl_verb_reconciliation", surface], [fqn])
-    log("track-a-dag", dags[target_dag][:file], "reconciled #{fqn} under #{surface} (already allowed by #{jp_id})") unless added.empty?
+    queue_sequence_item(dags[target_dag][:file], ["dsl_verb_reconciliation", surface], fqn,
+                        "track-a-dag", "reconciled #{fqn} under #{surface} (already allowed by #{jp_id})")
   end
 end
+flush_sequence_patches
 
 # ---------------------------------------------------------------------------
 # 7. EXCLUDED_VERBS.md — decision record so this isn't rediscovered as a
@@ -27,6 +27,7 @@
 
 require "yaml"
 require "date"
+require "set"
 
 APPLY = ARGV.include?("--apply")
 
@@ -44,24 +45,42 @@ VERBS_TO_DELETE = %w[]
 # re-verified confirmation — don't trust a "never implemented" claim
 # without running this script against it first.
 
-LOAD = ->(f) { YAML.safe_load(File.read(f), permitted_classes: [Date], permitted_symbols: [], aliases: true) }
+# Parsed at most once per file: every verb checks the same pack, DAG and
+# macro files, so re-reading and re-parsing them per verb is wasted work.
+# Nothing below mutates the loaded documents.
+YAML_CACHE = Hash.new do |cache, f|
+  cache[f] = YAML.safe_load(File.read(f), permitted_classes: [Date], permitted_symbols: [], aliases: true)
+end
+LOAD = ->(f) { YAML_CACHE[f] }
+
+# Resolved once up front rather than discovered per call via ENOENT. The
+# source reference check is what stops a live verb from being deleted, so
+# a missing rg has to stop the run instead of reading as "no references"
+# for every verb.
+RG = ENV.fetch("PATH", "").split(File::PATH_SEPARATOR)
+        .map { |d| File.join(d, "rg") }
+        .find { |p| File.file?(p) && File.executable?(p) }
+abort "ripgrep (rg) not found on PATH — required for the source reference check" if RG.nil? && VERBS_TO_DELETE.any?
 
 def rg(term, dirs)
   dirs = dirs.select { |d| Dir.exist?(d) }
   return [] if dirs.empty?
-  out = IO.popen(["rg", "-n", "--no-heading", "-F", term, *dirs], err: [:child, :out]) { |io| io.read }
-  out.lines.map(&:chomp)
-rescue Errno::ENOENT
-  warn "ripgrep (rg) not found on PATH"
-  []
+  IO.popen([RG, "-n", "--no-heading", "-F", term, *dirs], err: [:child, :out]) { |io| io.each_line(chomp: true).to_a }
 end
 
+# Verb files are read at most once and edited in memory; every file a
+# deletion touches is written back exactly once after all verbs have been
+# processed, so several verbs removed from the same domain file cost one
+# read and one write.
+VERB_FILE_LINES = Hash.new { |cache, path| cache[path] = File.readlines(path) }
+DIRTY_VERB_FILES = Set.new
+
 # Delete a verb's `<action>:` block from its domain file, preserving
 # every other line and comment verbatim (text patch, not a YAML re-dump —
 # same approach as 10_apply_remediation.rb's insertions, for the same
 # reason: don't destroy hand-authored comments elsewhere in the file).
 def remove_verb_block(path, domain, action)
-  lines = File.readlines(path)
+  lines = VERB_FILE_LINES[path]
   domain_idx = nil
   lines.each_with_index do |line, i|
     if line.strip == "#{domain}:" && line[/^ */].size.positive?
@@ -112,7 +131,10 @@ def remove_verb_block(path, domain, action)
   end
 
   new_lines = lines[0...action_idx] + lines[end_idx..-1]
-  File.write(path, new_lines.join) if APPLY
+  if APPLY
+    VERB_FILE_LINES[path] = new_lines
+    DIRTY_VERB_FILES << path
+  end
 
   # Note if this leaves the domain's verbs block empty — worth a manual
   # look, not auto-cleaned here.
@@ -122,11 +144,21 @@ def remove_verb_block(path, domain, action)
   true
 end
 
+SOURCE_DIRS = %w[rust/src rust/crates rust/xtask rust/tests]
+AGENT_DIRS = %w[rust/config/agent]
+
+# The ripgrep reference checks are subprocess-bound and independent of
+# each other, so start them all up front on threads and let the per-verb
+# loop below just collect the results.
+RG_SCANS = VERBS_TO_DELETE.uniq.product([SOURCE_DIRS, AGENT_DIRS]).to_h do |fqn, dirs|
+  [[fqn, dirs], Thread.new { rg(fqn, dirs) }]
+end
+
 puts "=" * 72
 puts "DELETE CONFIRMED-DEAD VERBS"
 puts "=" * 72
 
-VERBS_TO_DELETE.each do |fqn|
+VERBS_TO_DELETE.uniq.each do |fqn|
   domain, action = fqn.split(".", 2)
   puts "\n## #{fqn}"
 
@@ -164,10 +196,10 @@ VERBS_TO_DELETE.each do |fqn|
     end
   end
 
-  source_hits = rg(fqn, %w[rust/src rust/crates rust/xtask rust/tests])
+  source_hits = RG_SCANS[[fqn, SOURCE_DIRS]].value
   blocking.concat(source_hits.map { |h| "referenced in source: #{h}" })
 
-  agent_hits = rg(fqn, %w[rust/config/agent])
+  agent_hits = RG_SCANS[[fqn, AGENT_DIRS]].value
   agent_hits.each { |h| puts "  INFO (non-blocking, known-stale NLU files): #{h}" }
 
   if blocking.empty?
@@ -192,6 +224,8 @@ VERBS_TO_DELETE.each do |fqn|
   end
 end
 
+DIRTY_VERB_FILES.each { |f| File.write(f, VERB_FILE_LINES[f].join) }
+
 puts "\n" + "=" * 72
 puts APPLY ? "APPLIED" : "DRY RUN (pass --apply to actually delete clean verbs)"
 puts "=" * 72
@@ -4372,23 +4372,33 @@ BEGIN
         RETURN;
     END IF;
 
-    -- Insert new similarities based on embeddings
+    -- Score each unordered pair once, then write both directions
+    WITH pairs AS (
+        SELECT
+            dt1.type_code AS code_a,
+            dt2.type_code AS code_b,
+            1 - (dt1.embedding <=> dt2.embedding) AS similarity
+        FROM "ob-poc".document_types dt1
+        JOIN "ob-poc".document_types dt2
+          ON dt1.type_code < dt2.type_code
+        WHERE dt1.embedding IS NOT NULL
+          AND dt2.embedding IS NOT NULL
+    )
     INSERT INTO "ob-poc".csg_semantic_similarity_cache
         (source_type, source_code, target_type, target_code,
          cosine_similarity, relationship_type, computed_at, expires_at)
     SELECT
-        'document_type', dt1.type_code,
-        'document_type', dt2.type_code,
-        1 - (dt1.embedding <=> dt2.embedding) as similarity,
+        'document_type', d.source_code,
+        'document_type', d.target_code,
+        p.similarity,
         'alternative',
         NOW(),
         NOW() + INTERVAL '7 days'
-    FROM "ob-poc".document_types dt1
-    CROSS JOIN "ob-poc".document_types dt2
-    WHERE dt1.type_code != dt2.type_code
-      AND dt1.embedding IS NOT NULL
-      AND dt2.embedding IS NOT NULL
-      AND 1 - (dt1.embedding <=> dt2.embedding) > 0.5
+    FROM pairs p
+    CROSS JOIN LATERAL (
+        VALUES (p.code_a, p.code_b), (p.code_b, p.code_a)
+    ) AS d(source_code, target_code)
+    WHERE p.similarity > 0.5
     ON CONFLICT (source_type, source_code, target_type, target_code)
     DO UPDATE SET
         cosine_similarity = EXCLUDED.cosine_similarity,
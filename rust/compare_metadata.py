@@ -1,5 +1,4 @@
 import yaml
-import re
 
 # Table list from migration files
 migration_tables = [
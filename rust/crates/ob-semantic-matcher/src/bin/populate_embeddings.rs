@@ -19,6 +19,7 @@
 //! Performance (optimized):
 //!   - Parallel processing: Uses Rayon to embed batches in parallel across CPU cores
 //!   - Delta loading: Only embeds NEW patterns (skips already-embedded)
+//!   - Stale-only centroids: Only recomputes centroids whose patterns changed
 //!   - Bulk INSERT: Uses PostgreSQL UNNEST to insert batches efficiently
 //!   - Result: Initial load ~5-10 sec (was 60-90 sec), incremental < 1 sec
 //!
@@ -494,7 +495,7 @@ async fn populate_client_group_embeddings(
 /// Statistics from centroid computation
 #[derive(Debug)]
 struct CentroidStats {
-    total_verbs: usize,
+    recomputed_verbs: usize,
     inserted: usize,
     updated: usize,
     deleted: usize,
@@ -508,15 +509,30 @@ struct CentroidStats {
 /// 2. Refine with pattern-level matches within shortlist
 ///
 /// Call this AFTER all pattern embeddings are populated.
+///
+/// Only verbs whose centroid is stale are recomputed: no centroid yet, a
+/// phrase count that no longer matches, or a pattern embedding written after
+/// the centroid. Unchanged verbs are neither loaded nor rewritten.
 async fn compute_and_store_centroids(pool: &PgPool) -> Result<CentroidStats> {
     info!("Computing verb centroids...");
 
-    // 1) Load all pattern embeddings grouped by verb
+    // 1) Load pattern embeddings for verbs with a stale centroid
     let rows: Vec<(String, Vec<f32>)> = sqlx::query_as(
         r#"
-        SELECT verb_name, embedding::real[]
-        FROM "ob-poc".verb_pattern_embeddings
-        WHERE embedding IS NOT NULL
+        WITH stale AS (
+            SELECT p.verb_name
+            FROM "ob-poc".verb_pattern_embeddings p
+            LEFT JOIN "ob-poc".verb_centroids c ON c.verb_name = p.verb_name
+            WHERE p.embedding IS NOT NULL
+            GROUP BY p.verb_name, c.phrase_count, c.updated_at
+            HAVING c.updated_at IS NULL
+                OR c.phrase_count <> COUNT(*)
+                OR MAX(p.updated_at) > c.updated_at
+        )
+        SELECT p.verb_name, p.embedding::real[]
+        FROM "ob-poc".verb_pattern_embeddings p
+        JOIN stale s ON s.verb_name = p.verb_name
+        WHERE p.embedding IS NOT NULL
         "#,
     )
     .fetch_all(pool)
@@ -531,7 +547,7 @@ async fn compute_and_store_centroids(pool: &PgPool) -> Result<CentroidStats> {
         map.entry(verb_name).or_default().push(embedding);
     }
 
-    info!("  Found {} unique verbs", map.len());
+    info!("  Found {} verbs with stale centroids", map.len());
 
     // 3) Compute + upsert centroids
     let mut inserted = 0;
@@ -590,15 +606,15 @@ async fn compute_and_store_centroids(pool: &PgPool) -> Result<CentroidStats> {
     .context("Failed to cleanup orphaned centroids")?;
 
     let stats = CentroidStats {
-        total_verbs: map.len(),
+        recomputed_verbs: map.len(),
         inserted,
         updated,
         deleted: deleted as usize,
     };
 
     info!(
-        "  Centroids: {} inserted, {} updated, {} deleted (total: {} verbs)",
-        stats.inserted, stats.updated, stats.deleted, stats.total_verbs
+        "  Centroids: {} inserted, {} updated, {} deleted (recomputed: {} verbs)",
+        stats.inserted, stats.updated, stats.deleted, stats.recomputed_verbs
     );
 
     // Refresh index stats for good recall
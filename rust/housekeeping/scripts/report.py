@@ -1,6 +1,6 @@
 
 #!/usr/bin/env python3
-import os, json, re, sys, datetime
+import os, json, re, datetime
 from collections import defaultdict
 
 OUT = "target/housekeeping"
@@ -58,32 +58,41 @@ def parse_machete(path):
             unused.append({"crate": m.group(1), "dep": m.group(2)})
     return unused
 
+# Lines mentioning both "unused" and "pub" (which also covers "public"),
+# case-insensitively; matched over the whole buffer instead of lowercasing
+# and substring-testing every line.
+WARN_UNUSED_PUB_RE = re.compile(r"^(?=.*unused)(?=.*pub).*$", re.I | re.M)
+WARN_SYMBOL_RE = re.compile(r"([A-Za-z0-9_]+(::[A-Za-z0-9_]+)+)")
+
 def parse_warnalyzer(path):
     txt = read(path)
     items = []
-    for line in txt.splitlines():
-        low = line.lower()
-        if "unused" in low and ("pub" in low or "public" in low):
-            m = re.search(r"([A-Za-z0-9_]+(::[A-Za-z0-9_]+)+)", line)
-            items.append({"symbol": m.group(1) if m else line.strip(), "raw": line.strip()})
+    for hit in WARN_UNUSED_PUB_RE.finditer(txt):
+        line = hit.group(0)
+        m = WARN_SYMBOL_RE.search(line)
+        items.append({"symbol": m.group(1) if m else line.strip(), "raw": line.strip()})
     return items
 
+# lcov records are scanned with whole-buffer regex passes rather than a
+# Python loop over every DA line; a workspace tracefile has one DA line per
+# instrumented source line, so the per-line loop dominated.
+LCOV_SF_RE = re.compile(r"^SF:(.*)$", re.M)
+LCOV_END_RE = re.compile(r"^end_of_record", re.M)
+LCOV_DA_RE = re.compile(r"^DA:[^,\n]*,\d+\r?$", re.M)
+LCOV_DA_ZERO_RE = re.compile(r"^DA:[^,\n]*,0+\r?$", re.M)
+
 def parse_lcov(path):
     txt = read(path)
     files = {}
-    cur = None
-    for line in txt.splitlines():
-        if line.startswith("SF:"):
-            cur = line[3:].strip()
-            files[cur] = {"lines_total":0, "lines_hit":0}
-        elif line.startswith("DA:") and cur:
-            parts = line[3:].split(",")
-            if len(parts) == 2:
-                files[cur]["lines_total"] += 1
-                if int(parts[1]) > 0:
-                    files[cur]["lines_hit"] += 1
-        elif line.startswith("end_of_record"):
-            cur = None
+    records = list(LCOV_SF_RE.finditer(txt))
+    for i, sf in enumerate(records):
+        stop = records[i + 1].start() if i + 1 < len(records) else len(txt)
+        end = LCOV_END_RE.search(txt, sf.end(), stop)
+        if end:
+            stop = end.start()
+        total = len(LCOV_DA_RE.findall(txt, sf.end(), stop))
+        zero = len(LCOV_DA_ZERO_RE.findall(txt, sf.end(), stop))
+        files[sf.group(1).strip()] = {"lines_total": total, "lines_hit": total - zero}
     zero_cov = [f for f,stats in files.items() if stats["lines_total"]>0 and stats["lines_hit"]==0]
     return files, zero_cov
 
@@ -107,61 +116,75 @@ def main():
 
     ts = datetime.datetime.utcnow().isoformat() + "Z"
     report_path = f"{OUT}/housekeeping_report.md"
-    with open(report_path, "w", encoding="utf-8") as w:
-        w.write(f"# Housekeeping Report\\n\\nGenerated: {ts}\\n\\n")
-        w.write("## Summary\\n")
-        w.write(f"- Unused deps (machete fast): **{len(machete)}**\\n")
-        w.write(f"- Unused deps (udeps precise): **{len(udeps)}**\\n")
-        w.write(f"- Unused public items (workspace): **{len(warn)}**\\n")
-        w.write(f"- Zero-coverage files: **{len(zero_cov)}**\\n\\n")
-
-        w.write("## Action Buckets\\n")
-        w.write("### Delete / Demote Candidates (ranked)\\n")
-        if ranked:
-            w.write("| Item | Score | Recommendation | Evidence |\\n|---|---:|---|---|\\n")
-            for item, score in ranked[:200]:
-                rec = "Demote to pub(crate) or delete" if "::" in item else "Inspect"
-                evs = []
-                if any(item in (x.get('symbol','') + x.get('raw','')) for x in warn): evs.append("unused pub")
-                if item in zero_cov: evs.append("zero coverage")
-                ev = ", ".join(evs) if evs else "-"
-                w.write(f"| `{item}` | {score} | {rec} | {ev} |\\n")
-        else:
-            w.write("_No ranked items. Run sweep first._\\n")
-
-        w.write("\\n### Unused Dependencies (precise: cargo-udeps)\\n")
-        if udeps:
-            w.write("| Crate | Dependency |\\n|---|---|\\n")
-            for u in udeps:
-                w.write(f"| `{u['crate']}` | `{u['dep']}` |\\n")
-        else:
-            w.write("_None detected or udeps missing._\\n")
-
-        w.write("\\n### Unused Dependencies (fast: cargo-machete)\\n")
-        if machete:
-            w.write("| Crate | Dependency |\\n|---|---|\\n")
-            for u in machete:
-                w.write(f"| `{u['crate']}` | `{u['dep']}` |\\n")
-        else:
-            w.write("_None detected or machete missing._\\n")
-
-        w.write("\\n### Zero-Coverage Files\\n")
-        if zero_cov:
-            for f in zero_cov[:300]:
-                w.write(f"- `{f}`\\n")
-        else:
-            w.write("_None detected or coverage missing._\\n")
-
-        w.write("\\n## Raw Outputs\\n")
-        w.write(f"- `machete.txt`: {OUT}/machete.txt\\n")
-        w.write(f"- `udeps.json`: {OUT}/udeps.json\\n")
-        w.write(f"- `warnalyzer.txt`: {OUT}/warnalyzer.txt\\n")
-        w.write(f"- `lcov.info`: {OUT}/lcov.info\\n")
-        w.write("\\n---\\n")
-        w.write("### Next Steps\\n")
-        w.write("1. For **unused pub**: shrink visibility (`pub(crate)`), re-run sweep; if still unused, delete.\\n")
-        w.write("2. For **deps** where machete & udeps agree: remove in `Cargo.toml`, run `cargo clippy --fix`, test.\\n")
-        w.write("3. For **zero-coverage** modules: confirm with callgraph; if unreachable & unreferenced, delete or move to benches/examples.\\n")
-        w.write("4. Add this workflow to CI to keep the codebase clean.\\n")
+    out = []
+    out.append(f"# Housekeeping Report\n\nGenerated: {ts}\n\n")
+    out.append("## Summary\n")
+    out.append(f"- Unused deps (machete fast): **{len(machete)}**\n")
+    out.append(f"- Unused deps (udeps precise): **{len(udeps)}**\n")
+    out.append(f"- Unused public items (workspace): **{len(warn)}**\n")
+    out.append(f"- Zero-coverage files: **{len(zero_cov)}**\n\n")
+
+    out.append("## Action Buckets\n")
+    out.append("### Delete / Demote Candidates (ranked)\n")
+    if ranked:
+        out.append("| Item | Score | Recommendation | Evidence |\n|---|---:|---|---|\n")
+        # Evidence lookups: a set for zero-coverage membership, and every
+        # warning's text joined once so each item is one substring search
+        # (items never contain a newline, so no match can span entries).
+        zero_cov_set = set(zero_cov)
+        warn_text = "\n".join(x.get('symbol','') + x.get('raw','') for x in warn)
+        for item, score in ranked[:200]:
+            rec = "Demote to pub(crate) or delete" if "::" in item else "Inspect"
+            evs = []
+            if item in warn_text: evs.append("unused pub")
+            if item in zero_cov_set: evs.append("zero coverage")
+            ev = ", ".join(evs) if evs else "-"
+            out.append(f"| `{item}` | {score} | {rec} | {ev} |\n")
+    else:
+        out.append("_No ranked items. Run sweep first._\n")
 
+    out.append("\n### Unused Dependencies (precise: cargo-udeps)\n")
+    if udeps:
+        out.append("| Crate | Dependency |\n|---|---|\n")
+        for u in udeps:
+            out.append(f"| `{u['crate']}` | `{u['dep']}` |\n")
+    else:
+        out.append("_None detected or udeps missing._\n")
+
+    out.append("\n### Unused Dependencies (fast: cargo-machete)\n")
+    if machete:
+        out.append("| Crate | Dependency |\n|---|---|\n")
+        for u in machete:
+            out.append(f"| `{u['crate']}` | `{u['dep']}` |\n")
+    else:
+        out.append("_None detected or machete missing._\n")
+
+    out.append("\n### Zero-Coverage Files\n")
+    if zero_cov:
+        for f in zero_cov[:300]:
+            out.append(f"- `{f}`\n")
+    else:
+        out.append("_None detected or coverage missing._\n")
+
+    out.append("\n## Raw Outputs\n")
+    out.append(f"- `machete.txt`: {OUT}/machete.txt\n")
+    out.append(f"- `udeps.json`: {OUT}/udeps.json\n")
+    out.append(f"- `warnalyzer.txt`: {OUT}/warnalyzer.txt\n")
+    out.append(f"- `lcov.info`: {OUT}/lcov.info\n")
+    out.append("\n---\n")
+    out.append("### Next Steps\n")
+    out.append("1. For **unused pub**: shrink visibility (`pub(crate)`), re-run sweep; if still unused, delete.\n")
+    out.append("2. For **deps** where machete & udeps agree: remove in `Cargo.toml`, run `cargo clippy --fix`, test.\n")
+    out.append("3. For **zero-coverage** modules: confirm with callgraph; if unreachable & unreferenced, delete or move to benches/examples.\n")
+    out.append("4. Add this workflow to CI to keep the codebase clean.\n")
+
+    # Assemble the whole report first and publish it with one write plus an
+    # atomic rename, so a reader never sees a half-written report.
+    tmp_path = f"{report_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as w:
+        w.write("".join(out))
+    os.replace(tmp_path, report_path)
     print(f"Wrote {report_path}")
+
+if __name__ == "__main__":
+    main()
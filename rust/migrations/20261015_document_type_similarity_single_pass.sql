@@ -0,0 +1,60 @@
+-- refresh_document_type_similarities(): score each unordered document-type
+-- pair once instead of twice.
+--
+-- The previous body CROSS JOINed document_types with itself on
+-- `dt1.type_code != dt2.type_code`, so every pair (a, b) was scored again as
+-- (b, a), and the cosine distance was evaluated twice per row (once in the
+-- SELECT list, once in the WHERE threshold). Cosine similarity is symmetric,
+-- so the pairs are now enumerated with `<`, the distance is computed once in
+-- a CTE, and both cache directions are emitted from that single score via a
+-- LATERAL VALUES fan-out. The cache contents are unchanged.
+
+CREATE OR REPLACE FUNCTION "ob-poc".refresh_document_type_similarities()
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Delete expired entries
+    DELETE FROM "ob-poc".csg_semantic_similarity_cache
+    WHERE expires_at < NOW();
+
+    -- Only proceed if vector extension is available
+    IF NOT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'vector') THEN
+        RAISE NOTICE 'pgvector extension not installed, skipping similarity refresh';
+        RETURN;
+    END IF;
+
+    -- Score each unordered pair once, then write both directions
+    WITH pairs AS (
+        SELECT
+            dt1.type_code AS code_a,
+            dt2.type_code AS code_b,
+            1 - (dt1.embedding <=> dt2.embedding) AS similarity
+        FROM "ob-poc".document_types dt1
+        JOIN "ob-poc".document_types dt2
+          ON dt1.type_code < dt2.type_code
+        WHERE dt1.embedding IS NOT NULL
+          AND dt2.embedding IS NOT NULL
+    )
+    INSERT INTO "ob-poc".csg_semantic_similarity_cache
+        (source_type, source_code, target_type, target_code,
+         cosine_similarity, relationship_type, computed_at, expires_at)
+    SELECT
+        'document_type', d.source_code,
+        'document_type', d.target_code,
+        p.similarity,
+        'alternative',
+        NOW(),
+        NOW() + INTERVAL '7 days'
+    FROM pairs p
+    CROSS JOIN LATERAL (
+        VALUES (p.code_a, p.code_b), (p.code_b, p.code_a)
+    ) AS d(source_code, target_code)
+    WHERE p.similarity > 0.5
+    ON CONFLICT (source_type, source_code, target_type, target_code)
+    DO UPDATE SET
+        cosine_similarity = EXCLUDED.cosine_similarity,
+        computed_at = NOW(),
+        expires_at = NOW() + INTERVAL '7 days';
+END;
+$$;
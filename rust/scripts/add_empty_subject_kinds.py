@@ -6,9 +6,7 @@ that currently rely on the domain heuristic fallback.
 Only modifies verbs that don't already have subject_kinds in their metadata.
 """
 
-import sys
 import os
-import re
 
 # Domains where verbs should have subject_kinds: [] (no entity filter)
 NO_ENTITY_FILTER_DOMAINS = {
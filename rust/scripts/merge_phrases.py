@@ -25,6 +25,11 @@ import sys
 
 VERBS_DIR = os.path.join(os.path.dirname(__file__), "..", "config", "verbs")
 
+# Compiled once per run rather than per call / per line.
+VERBS_SECTION_RE = re.compile(r"^\s+verbs:\s*$")
+KEY_LINE_RE = re.compile(r"^(\s+)([^\s:]+):\s*$")
+PHRASES_KEY_RE = re.compile(r"^( *)invocation_phrases:\s*$")
+
 # Maps domain keys from draft/extension files to their YAML file paths
 DOMAIN_FILE_MAP = {
     "view": "view.yaml",
@@ -73,21 +78,19 @@ def find_verb_block_end(lines, verb_key, domain_key):
     Find the line range for a verb definition block within a domain YAML.
     Returns (verb_start_line, verb_indent, next_verb_or_section_line).
     """
-    # Find the verb key line
-    verb_pattern = re.compile(r"^(\s+)" + re.escape(verb_key) + r":\s*$")
     in_verbs_section = False
     verbs_indent = None
 
     for i, line in enumerate(lines):
         # Find "verbs:" section
-        if re.match(r"^\s+verbs:\s*$", line):
+        if VERBS_SECTION_RE.match(line):
             in_verbs_section = True
             verbs_indent = len(line) - len(line.lstrip())
             continue
 
         if in_verbs_section:
-            m = verb_pattern.match(line)
-            if m:
+            m = KEY_LINE_RE.match(line)
+            if m and m.group(2) == verb_key:
                 verb_indent = len(m.group(1))
                 verb_start = i
 
@@ -109,12 +112,9 @@ def find_invocation_phrases_block(lines, verb_start, verb_end, verb_indent):
     Find existing invocation_phrases block within a verb definition.
     Returns (phrases_start, phrases_end) or (None, None) if not found.
     """
-    phrases_pattern = re.compile(
-        r"^" + " " * (verb_indent + 2) + r"invocation_phrases:\s*$"
-    )
-
     for i in range(verb_start, verb_end):
-        if phrases_pattern.match(lines[i]):
+        m = PHRASES_KEY_RE.match(lines[i])
+        if m and len(m.group(1)) == verb_indent + 2:
             phrases_start = i
             # Find end of phrase list
             for j in range(i + 1, verb_end):
@@ -236,8 +236,7 @@ def merge_phrases_into_file(
                     break
 
             new_lines = [f'{phrase_indent}- "{p}"' for p in to_add]
-            for idx, line in enumerate(new_lines):
-                result_lines.insert(insert_pos + idx, line)
+            result_lines[insert_pos:insert_pos] = new_lines
         else:
             # No invocation_phrases block exists, insert one after verb description
             # Find where to insert (after description line, or after verb_key line)
@@ -254,8 +253,7 @@ def merge_phrases_into_file(
             new_lines = [f"{desc_indent}invocation_phrases:"]
             new_lines.extend([f'{phrase_indent}- "{p}"' for p in to_add])
 
-            for idx, line in enumerate(new_lines):
-                result_lines.insert(insert_after + 1 + idx, line)
+            result_lines[insert_after + 1 : insert_after + 1] = new_lines
 
     with open(yaml_path, "w") as f:
         f.write("\n".join(result_lines))
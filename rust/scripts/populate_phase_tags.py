@@ -14,7 +14,7 @@ Usage:
 
 import sys
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 
 # ─── Domain → phase_tags mapping ───────────────────────────────────────────
 
@@ -214,8 +214,12 @@ def format_phase_tags(tags):
     return "[" + ", ".join(tags) + "]"
 
 
-def process_file(filepath, config_dir, dry_run=False, verbose=False):
-    """Process a single YAML file and add phase_tags where needed."""
+def process_file(filepath, config_dir, dry_run=False, verbose=False, log=print):
+    """Process a single YAML file and add phase_tags where needed.
+
+    Messages go through ``log`` so callers running files concurrently can
+    buffer them per file and print them in a stable order.
+    """
     with open(filepath, 'r') as f:
         lines = f.readlines()
 
@@ -223,9 +227,10 @@ def process_file(filepath, config_dir, dry_run=False, verbose=False):
     rel_path = os.path.relpath(filepath, config_dir)
     rel_dir = os.path.dirname(rel_path)
 
-    # First pass: find domains in this file
+    # First pass: find domains in this file, remembering the unmapped ones
+    # so the warning below doesn't need a second scan of the file
     domains_in_file = {}
-    current_domain = None
+    unmapped = []
     for line in lines:
         stripped = line.rstrip()
         indent = len(line) - len(line.lstrip()) if stripped else 0
@@ -234,24 +239,15 @@ def process_file(filepath, config_dir, dry_run=False, verbose=False):
         if indent == 2 and trimmed.endswith(':') and not trimmed.startswith('#') and not trimmed.startswith('-'):
             dname = trimmed.rstrip(':')
             if dname not in ('description', 'verbs', 'version'):
-                current_domain = dname
                 tags = get_phase_tags(dname, rel_dir)
                 if tags:
                     domains_in_file[dname] = tags
+                else:
+                    unmapped.append(dname)
 
     if not domains_in_file:
-        # Check if there are unmapped domains
-        unmapped = []
-        for line in lines:
-            stripped = line.rstrip()
-            indent = len(line) - len(line.lstrip()) if stripped else 0
-            trimmed = stripped.strip()
-            if indent == 2 and trimmed.endswith(':') and not trimmed.startswith('#') and not trimmed.startswith('-'):
-                dname = trimmed.rstrip(':')
-                if dname not in ('description', 'verbs', 'version'):
-                    unmapped.append(dname)
         if unmapped:
-            print(f"  WARN: No phase mapping for domains in {rel_path}: {unmapped}")
+            log(f"  WARN: No phase mapping for domains in {rel_path}: {unmapped}")
         return 0, []
 
     # Second pass: find metadata blocks and add phase_tags
@@ -325,7 +321,7 @@ def process_file(filepath, config_dir, dry_run=False, verbose=False):
                 fqn = f"{current_domain}.{current_verb}" if current_verb else current_domain
                 changed_verbs.append(fqn)
                 if verbose:
-                    print(f"    {fqn} → phase_tags: {format_phase_tags(tags)}")
+                    log(f"    {fqn} → phase_tags: {format_phase_tags(tags)}")
             else:
                 new_lines.extend(metadata_lines)
 
@@ -356,22 +352,37 @@ def main():
     total_files = 0
     all_changed_verbs = []
 
-    # Process all YAML files
+    # Collect all YAML files, then process them on a thread pool. Each file
+    # is read and written independently, so their I/O overlaps; results are
+    # reported in walk order so the output matches a serial run.
+    filepaths = []
     for root, dirs, files in os.walk(config_dir):
         dirs.sort()
         for fname in sorted(files):
             if fname.endswith('.yaml') and not fname.startswith('_'):
-                filepath = os.path.join(root, fname)
+                filepaths.append(os.path.join(root, fname))
+
+    def run(filepath):
+        messages = []
+        changes, changed_verbs = process_file(
+            filepath, config_dir, dry_run=dry_run, verbose=verbose,
+            log=messages.append
+        )
+        return messages, changes, changed_verbs
+
+    with ThreadPoolExecutor() as pool:
+        for filepath, (messages, changes, changed_verbs) in zip(
+            filepaths, pool.map(run, filepaths)
+        ):
+            for message in messages:
+                print(message)
+            if changes > 0:
                 rel_path = os.path.relpath(filepath, config_dir)
-                changes, changed_verbs = process_file(
-                    filepath, config_dir, dry_run=dry_run, verbose=verbose
-                )
-                if changes > 0:
-                    total_files += 1
-                    total_changes += changes
-                    all_changed_verbs.extend(changed_verbs)
-                    prefix = "[DRY] " if dry_run else ""
-                    print(f"  {prefix}{rel_path}: {changes} verbs updated")
+                total_files += 1
+                total_changes += changes
+                all_changed_verbs.extend(changed_verbs)
+                prefix = "[DRY] " if dry_run else ""
+                print(f"  {prefix}{rel_path}: {changes} verbs updated")
 
     print(f"\n{'[DRY RUN] ' if dry_run else ''}Total: {total_changes} verbs across {total_files} files")
 
@@ -58,6 +58,19 @@ SCENARIOS=(
     "05_sub_advised_fund"
 )
 
+# Scenario timing reads bash's EPOCHREALTIME (bash 5+) instead of forking
+# `date` and `bc` around every scenario; older shells fall back to them.
+if [ -n "${EPOCHREALTIME:-}" ]; then
+    clock_start() { START_US=${EPOCHREALTIME/[.,]/}; }
+    clock_stop() {
+        local us=$(( ${EPOCHREALTIME/[.,]/} - START_US ))
+        printf -v DURATION '%d.%06d' $((us / 1000000)) $((us % 1000000))
+    }
+else
+    clock_start() { START_TIME=$(date +%s.%N); }
+    clock_stop() { DURATION=$(echo "$(date +%s.%N) - $START_TIME" | bc); }
+fi
+
 # Run each scenario
 for scenario in "${SCENARIOS[@]}"; do
     SCENARIO_FILE="$SCENARIOS_DIR/${scenario}.dsl"
@@ -73,16 +86,14 @@ for scenario in "${SCENARIOS[@]}"; do
     fi
 
     # Execute the scenario
-    START_TIME=$(date +%s.%N)
+    clock_start
 
     if "$DSL_CLI" execute -f "$SCENARIO_FILE" --db-url "$DB_URL" 2>&1; then
-        END_TIME=$(date +%s.%N)
-        DURATION=$(echo "$END_TIME - $START_TIME" | bc)
+        clock_stop
         echo -e "${GREEN}PASSED${NC} (${DURATION}s)"
         ((PASSED++))
     else
-        END_TIME=$(date +%s.%N)
-        DURATION=$(echo "$END_TIME - $START_TIME" | bc)
+        clock_stop
         echo -e "${RED}FAILED${NC} (${DURATION}s)"
         ((FAILED++))
 
@@ -33,6 +33,7 @@ use {
         types::LeiRecord, types::OwnershipChain, types::SuccessorResult, types::UboStatus,
         GleifClient, GleifEnrichmentService,
     },
+    futures::stream::{self, StreamExt},
     sqlx::PgPool,
     std::collections::HashMap,
     std::sync::Arc,
@@ -1236,10 +1237,19 @@ impl SemOsVerbOp for GleifTraceOwnership {
 
         let mut chain = Vec::new();
         let mut current_lei = lei.clone();
+        let mut current_record = start_record;
         let mut terminus = UboStatus::Unknown;
 
         for _depth in 0..10 {
-            match client.get_direct_parent(&current_lei).await? {
+            // The record in hand already says when no parent is reported -
+            // skip the relationship round trip for the terminal hop
+            let parent_rel = if current_record.may_have_direct_parent() {
+                client.get_direct_parent(&current_lei).await?
+            } else {
+                None
+            };
+
+            match parent_rel {
                 Some(rel) => {
                     let parent_lei = rel.attributes.relationship.end_node.id.clone();
                     let parent_record = client.get_lei_record(&parent_lei).await?;
@@ -1253,6 +1263,7 @@ impl SemOsVerbOp for GleifTraceOwnership {
                     });
 
                     current_lei = parent_lei;
+                    current_record = parent_record;
                 }
                 None => {
                     terminus = UboStatus::PublicFloat;
@@ -1294,6 +1305,10 @@ impl SemOsVerbOp for GleifTraceOwnership {
 // gleif.get-managed-funds
 // ═══════════════════════════════════════════════════════════════════════════════
 
+/// Maximum umbrella lookups in flight for `gleif.get-managed-funds`
+#[cfg(feature = "database")]
+const UMBRELLA_LOOKUP_CONCURRENCY: usize = 8;
+
 /// Get all funds managed by an investment manager
 pub(super) struct GleifGetManagedFunds;
 
@@ -1318,34 +1333,49 @@ impl SemOsVerbOp for GleifGetManagedFunds {
         let manager_record = client.get_lei_record(&manager_lei).await?;
         let manager_name = manager_record.attributes.entity.legal_name.name.clone();
 
-        let mut all_funds = client.get_managed_funds(&manager_lei).await?;
-        if let Some(lim) = limit {
-            all_funds.truncate(lim as usize);
-        }
-
-        let funds: Vec<DiscoveredEntity> = all_funds
-            .iter()
-            .map(DiscoveredEntity::from_lei_record)
-            .collect();
-
-        let mut fund_umbrellas: HashMap<String, DiscoveredEntity> = HashMap::new();
-        if resolve_umbrellas {
-            for fund in &funds {
-                if let Ok(Some(umbrella)) = client.get_umbrella_fund(&fund.lei).await {
-                    fund_umbrellas.insert(
-                        fund.lei.clone(),
-                        DiscoveredEntity::from_lei_record(&umbrella),
-                    );
-                }
+        // With a limit, stop paging once enough funds are in hand
+        let all_funds = match limit {
+            Some(lim) => {
+                client
+                    .get_managed_funds_limited(&manager_lei, lim as usize)
+                    .await?
             }
-        }
+            None => client.get_managed_funds(&manager_lei).await?,
+        };
+
+        // Project up front; the raw records are dropped before the umbrella fan-out
+        let funds: Vec<DiscoveredEntity> =
+            all_funds.into_iter().map(DiscoveredEntity::from).collect();
+
+        // Umbrella lookups are independent per fund - keep a bounded number in
+        // flight; the client's rate limiter still spaces the requests
+        let fund_umbrellas: HashMap<String, DiscoveredEntity> = if resolve_umbrellas {
+            let client = &client;
+            let fund_leis: Vec<String> = funds.iter().map(|f| f.lei.clone()).collect();
+            stream::iter(fund_leis)
+                .map(|lei| async move {
+                    let umbrella = client.get_umbrella_fund(&lei).await;
+                    (lei, umbrella)
+                })
+                .buffer_unordered(UMBRELLA_LOOKUP_CONCURRENCY)
+                .filter_map(|(lei, umbrella)| async move {
+                    match umbrella {
+                        Ok(Some(umbrella)) => Some((lei, DiscoveredEntity::from(umbrella))),
+                        _ => None,
+                    }
+                })
+                .collect()
+                .await
+        } else {
+            HashMap::new()
+        };
 
         let result = FundListResult {
             manager_lei: manager_lei.clone(),
             manager_name: Some(manager_name),
-            funds: funds.clone(),
-            fund_umbrellas,
             total_count: funds.len(),
+            funds,
+            fund_umbrellas,
         };
 
         Ok(Some(serde_json::json!({
@@ -1397,8 +1427,9 @@ impl SemOsVerbOp for GleifResolveSuccessor {
         let mut chain = vec![current_lei.clone()];
         let mut was_merged = false;
 
+        // Each hop's record is kept so the end of the chain is not fetched twice
+        let mut record = client.get_lei_record(&current_lei).await?;
         loop {
-            let record = client.get_lei_record(&current_lei).await?;
             let status = record
                 .attributes
                 .entity
@@ -1416,19 +1447,18 @@ impl SemOsVerbOp for GleifResolveSuccessor {
             } else {
                 break;
             }
+            record = client.get_lei_record(&current_lei).await?;
 
             if chain.len() > 10 {
                 break;
             }
         }
 
-        let final_record = client.get_lei_record(&current_lei).await?;
-
         let result = SuccessorResult {
             original_lei: lei,
             current_lei: current_lei.clone(),
             chain,
-            current_entity: DiscoveredEntity::from_lei_record(&final_record),
+            current_entity: DiscoveredEntity::from(record),
             was_merged,
         };
 
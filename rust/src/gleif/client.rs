@@ -4,13 +4,27 @@
 
 use super::types::*;
 use anyhow::{Context, Result};
-use reqwest::Client;
-use std::sync::Mutex;
+use futures::stream::{self, StreamExt};
+use rand::Rng;
+use reqwest::header::RETRY_AFTER;
+use reqwest::{Client, Response, StatusCode};
+use std::borrow::Cow;
+use std::collections::HashMap;
+use std::sync::{LazyLock, Mutex, OnceLock};
 use std::time::{Duration, Instant};
 use tokio::time::sleep;
 
 const GLEIF_API_BASE: &str = "https://api.gleif.org/api/v1";
 const RATE_LIMIT_DELAY_MS: u64 = 200; // 5 req/sec to be safe
+const RATE_LIMIT_MAX_DELAY_MS: u64 = 5_000;
+const RATE_LIMIT_RECOVERY_MS: u64 = 20;
+const MAX_ATTEMPTS: u32 = 4;
+const RETRY_BASE_DELAY_MS: u64 = 500;
+const LISTING_PAGE_SIZE: usize = 100;
+const MAX_MANAGED_FUND_PAGES: i32 = 50;
+const MAX_FUND_SEARCH_PAGES: i32 = 20;
+/// Listing pages requested at once once the last page is known
+const PAGE_FETCH_CONCURRENCY: usize = 4;
 
 /// A discovered parent-child relationship from tree traversal
 #[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
@@ -68,61 +82,237 @@ impl Default for TreeFetchOptions {
     }
 }
 
+/// Process-wide HTTP client shared by every `GleifClient`.
+///
+/// Verb ops construct a `GleifClient` per invocation; sharing one `reqwest::Client`
+/// (and therefore one connection pool) keeps the TCP+TLS connection to
+/// api.gleif.org alive across calls instead of handshaking on every op.
+///
+/// rustls offers `h2` via ALPN, so the concurrent listing-page and umbrella
+/// fetches multiplex over a single HTTP/2 connection; the adaptive window lets
+/// flow control grow to the link's bandwidth-delay product so 100-record pages
+/// are not held back by the default stream window.
+fn shared_http_client() -> Result<Client> {
+    static HTTP_CLIENT: OnceLock<Client> = OnceLock::new();
+
+    if let Some(client) = HTTP_CLIENT.get() {
+        return Ok(client.clone());
+    }
+
+    let client = Client::builder()
+        .timeout(Duration::from_secs(30))
+        .no_proxy()
+        .http2_adaptive_window(true)
+        // Small request/response exchanges - never wait on Nagle, and keep the
+        // pooled connection from being silently dropped by NAT between bursts
+        .tcp_nodelay(true)
+        .tcp_keepalive(Duration::from_secs(60))
+        .build()
+        .context("Failed to create HTTP client")?;
+
+    Ok(HTTP_CLIENT.get_or_init(|| client).clone())
+}
+
+/// Adaptive request spacing shared by every `GleifClient` (AIMD)
+///
+/// Spacing starts at `RATE_LIMIT_DELAY_MS`. A throttled response (429/503)
+/// doubles it, up to `RATE_LIMIT_MAX_DELAY_MS`, and holds further requests
+/// until any `Retry-After` has elapsed; each successful response walks it back
+/// down by `RATE_LIMIT_RECOVERY_MS`. Callers reserve their send slot under the
+/// lock, so concurrent callers stay spaced apart instead of firing together.
+struct RateLimiter {
+    /// Earliest instant the next request may be sent
+    next_request: Instant,
+    spacing: Duration,
+}
+
+impl RateLimiter {
+    fn new() -> Self {
+        Self {
+            next_request: Instant::now(),
+            spacing: Duration::from_millis(RATE_LIMIT_DELAY_MS),
+        }
+    }
+
+    /// Reserve the next send slot, returning how long to wait for it
+    fn reserve(&mut self, now: Instant) -> Duration {
+        let slot = self.next_request.max(now);
+        self.next_request = slot + self.spacing;
+        slot - now
+    }
+
+    fn on_success(&mut self) {
+        self.spacing = self
+            .spacing
+            .saturating_sub(Duration::from_millis(RATE_LIMIT_RECOVERY_MS))
+            .max(Duration::from_millis(RATE_LIMIT_DELAY_MS));
+    }
+
+    fn on_throttled(&mut self, now: Instant, retry_after: Option<Duration>) {
+        self.spacing = (self.spacing * 2).min(Duration::from_millis(RATE_LIMIT_MAX_DELAY_MS));
+        let resume_at = now + retry_after.unwrap_or(self.spacing);
+        self.next_request = self.next_request.max(resume_at);
+    }
+}
+
+static RATE_LIMITER: LazyLock<Mutex<RateLimiter>> =
+    LazyLock::new(|| Mutex::new(RateLimiter::new()));
+
+/// Parse a delay-seconds `Retry-After` header (the form GLEIF sends)
+fn retry_after(response: &Response) -> Option<Duration> {
+    response
+        .headers()
+        .get(RETRY_AFTER)?
+        .to_str()
+        .ok()?
+        .trim()
+        .parse::<u64>()
+        .ok()
+        .map(Duration::from_secs)
+}
+
+/// How long a fetched LEI record is served from the process-wide cache
+const LEI_CACHE_TTL: Duration = Duration::from_secs(15 * 60);
+/// Cap on cached LEI records; expired entries are swept when it is reached
+const LEI_CACHE_MAX_ENTRIES: usize = 10_000;
+
+/// Process-wide cache of LEI records, keyed by LEI
+///
+/// LEI reference data changes daily at most, while one session re-reads the
+/// same records repeatedly (enrich, trace, import, umbrella/manager lookups
+/// per fund). Serving repeats from memory for a short TTL removes those round
+/// trips without handing out meaningfully stale data.
+static LEI_RECORD_CACHE: LazyLock<Mutex<HashMap<String, (Instant, LeiRecord)>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+fn cached_lei_record(lei: &str) -> Option<LeiRecord> {
+    let cache = LEI_RECORD_CACHE.lock().unwrap();
+    cache
+        .get(lei)
+        .filter(|(fetched_at, _)| fetched_at.elapsed() < LEI_CACHE_TTL)
+        .map(|(_, record)| record.clone())
+}
+
+/// Cache records keyed by their own LEI, taking the lock once for the batch
+///
+/// Listing endpoints (direct-children, managed-funds) return full LEI
+/// records, so seeding the cache from them spares the per-record fetch that
+/// tree traversal and fund import otherwise make for every listed entity.
+fn cache_lei_records<'a>(records: impl IntoIterator<Item = &'a LeiRecord>) {
+    let mut cache = LEI_RECORD_CACHE.lock().unwrap();
+    let now = Instant::now();
+    for record in records {
+        if cache.len() >= LEI_CACHE_MAX_ENTRIES {
+            cache.retain(|_, (fetched_at, _)| fetched_at.elapsed() < LEI_CACHE_TTL);
+            if cache.len() >= LEI_CACHE_MAX_ENTRIES {
+                return;
+            }
+        }
+        cache.insert(record.lei().to_string(), (now, record.clone()));
+    }
+}
+
+/// Whether a response status is worth retrying (throttled or server-side)
+fn is_retryable_status(status: StatusCode) -> bool {
+    status == StatusCode::TOO_MANY_REQUESTS || status.is_server_error()
+}
+
+/// Back-off before retry `attempt` (1-based): exponential with equal jitter
+fn retry_backoff(attempt: u32) -> Duration {
+    let ceiling = RETRY_BASE_DELAY_MS << (attempt - 1).min(6);
+    Duration::from_millis(rand::thread_rng().gen_range(ceiling / 2..=ceiling))
+}
+
 pub(crate) struct GleifClient {
     client: Client,
-    last_request: Mutex<Instant>,
 }
 
 impl GleifClient {
     pub(crate) fn new() -> Result<Self> {
-        let client = Client::builder()
-            .timeout(Duration::from_secs(30))
-            .no_proxy()
-            .build()
-            .context("Failed to create HTTP client")?;
-
         Ok(Self {
-            client,
-            last_request: Mutex::new(Instant::now()),
+            client: shared_http_client()?,
         })
     }
 
     /// Enforce rate limiting between requests
     async fn rate_limit(&self) {
-        let elapsed = {
-            let last = self.last_request.lock().unwrap();
-            last.elapsed()
-        };
+        let wait = RATE_LIMITER.lock().unwrap().reserve(Instant::now());
 
-        if elapsed < Duration::from_millis(RATE_LIMIT_DELAY_MS) {
-            sleep(Duration::from_millis(RATE_LIMIT_DELAY_MS) - elapsed).await;
+        if !wait.is_zero() {
+            sleep(wait).await;
         }
+    }
+
+    /// Rate-limited GET with retries; every GLEIF request goes through here
+    ///
+    /// Throttling responses feed back into the shared request spacing.
+    /// Transient failures (connect/timeout errors, 429, 5xx) are retried up to
+    /// `MAX_ATTEMPTS` times with jittered exponential back-off, so one dropped
+    /// request does not abort a whole tree walk or ownership trace. The last
+    /// response is returned as-is for the caller's status handling.
+    async fn send_get(&self, url: &str) -> Result<Response> {
+        let mut attempt = 0;
+        loop {
+            self.rate_limit().await;
+            attempt += 1;
+
+            match self.client.get(url).send().await {
+                Ok(response) => {
+                    let status = response.status();
+                    if status == StatusCode::TOO_MANY_REQUESTS
+                        || status == StatusCode::SERVICE_UNAVAILABLE
+                    {
+                        let spacing = {
+                            let mut limiter = RATE_LIMITER.lock().unwrap();
+                            limiter.on_throttled(Instant::now(), retry_after(&response));
+                            limiter.spacing
+                        };
+                        tracing::warn!(
+                            status = %status,
+                            spacing_ms = spacing.as_millis() as u64,
+                            "GLEIF API throttled request - slowing down"
+                        );
+                    } else {
+                        RATE_LIMITER.lock().unwrap().on_success();
+                    }
+
+                    if !is_retryable_status(status) || attempt >= MAX_ATTEMPTS {
+                        return Ok(response);
+                    }
+                    tracing::debug!(url, status = %status, attempt, "Retrying GLEIF request");
+                }
+                Err(e) if attempt < MAX_ATTEMPTS && (e.is_connect() || e.is_timeout()) => {
+                    tracing::debug!(url, error = %e, attempt, "Retrying GLEIF request");
+                }
+                Err(e) => return Err(e).context("GLEIF API request failed"),
+            }
 
-        let mut last = self.last_request.lock().unwrap();
-        *last = Instant::now();
+            sleep(retry_backoff(attempt)).await;
+        }
     }
 
-    /// Fetch a single LEI record by LEI
+    /// Fetch a single LEI record by LEI (served from the record cache when fresh)
     pub(crate) async fn get_lei_record(&self, lei: &str) -> Result<LeiRecord> {
-        self.rate_limit().await;
+        if let Some(record) = cached_lei_record(lei) {
+            return Ok(record);
+        }
+
         let url = format!("{}/lei-records/{}", GLEIF_API_BASE, lei);
 
         let response: GleifResponse<LeiRecord> = self
-            .client
-            .get(&url)
-            .send()
+            .send_get(&url)
             .await
             .context("Failed to fetch LEI record")?
             .json()
             .await
             .context("Failed to parse LEI record response")?;
 
+        cache_lei_records([&response.data]);
         Ok(response.data)
     }
 
     /// Search for LEI records by entity name
     pub(crate) async fn search_by_name(&self, name: &str, limit: usize) -> Result<Vec<LeiRecord>> {
-        self.rate_limit().await;
         let url = format!(
             "{}/lei-records?filter[entity.legalName]={}&page[size]={}",
             GLEIF_API_BASE,
@@ -131,21 +321,19 @@ impl GleifClient {
         );
 
         let response = self
-            .client
-            .get(&url)
-            .send()
+            .send_get(&url)
             .await
             .context("Failed to search LEI records")?;
 
-        let text = response
-            .text()
+        let body = response
+            .bytes()
             .await
             .context("Failed to read response body")?;
 
         let parsed: GleifResponse<Vec<LeiRecord>> =
-            serde_json::from_str(&text).with_context(|| {
+            serde_json::from_slice(&body).with_context(|| {
                 // Try to get a more specific error by parsing as Value and then trying each record
-                let err_msg = match serde_json::from_str::<serde_json::Value>(&text) {
+                let err_msg = match serde_json::from_slice::<serde_json::Value>(&body) {
                     Ok(value) => {
                         // First try parsing all records one by one
                         let mut records_ok = true;
@@ -198,7 +386,7 @@ impl GleifClient {
                 format!(
                     "Failed to parse search response. {}. First 500 chars: {}",
                     err_msg,
-                    &text[..text.len().min(500)]
+                    body_preview(&body)
                 )
             })?;
 
@@ -207,13 +395,12 @@ impl GleifClient {
 
     /// Fetch direct parent relationship record
     pub(crate) async fn get_direct_parent(&self, lei: &str) -> Result<Option<RelationshipRecord>> {
-        self.rate_limit().await;
         let url = format!(
             "{}/lei-records/{}/direct-parent-relationship",
             GLEIF_API_BASE, lei
         );
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.send_get(&url).await?;
 
         if response.status() == reqwest::StatusCode::NOT_FOUND {
             return Ok(None);
@@ -229,13 +416,12 @@ impl GleifClient {
 
     /// Fetch ultimate parent relationship record
     pub(crate) async fn get_ultimate_parent(&self, lei: &str) -> Result<Option<RelationshipRecord>> {
-        self.rate_limit().await;
         let url = format!(
             "{}/lei-records/{}/ultimate-parent-relationship",
             GLEIF_API_BASE, lei
         );
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.send_get(&url).await?;
 
         if response.status() == reqwest::StatusCode::NOT_FOUND {
             return Ok(None);
@@ -251,57 +437,16 @@ impl GleifClient {
 
     /// Fetch all direct children of an entity
     pub(crate) async fn get_direct_children(&self, lei: &str) -> Result<Vec<LeiRecord>> {
-        let mut all_children = Vec::new();
-        let mut page = 1;
-        let page_size = 100;
-
-        loop {
-            self.rate_limit().await;
-            let url = format!(
-                "{}/lei-records/{}/direct-children?page%5Bnumber%5D={}&page%5Bsize%5D={}",
-                GLEIF_API_BASE, lei, page, page_size
-            );
-
-            let response = self.client.get(&url).send().await?;
-
-            if !response.status().is_success() {
-                // 404 means no children, which is fine
-                if response.status() == reqwest::StatusCode::NOT_FOUND {
-                    break;
-                }
-                let status = response.status();
-                let body = response.text().await.unwrap_or_default();
-                return Err(anyhow::anyhow!(
-                    "GLEIF API error {}: {}",
-                    status,
-                    body.chars().take(200).collect::<String>()
-                ));
-            }
-
-            let data: GleifResponse<Vec<LeiRecord>> = response
-                .json()
-                .await
-                .context("Failed to parse children response")?;
-
-            let count = data.data.len();
-            all_children.extend(data.data);
-
-            // If we got fewer than page_size, we're done
-            if count < page_size {
-                break;
-            }
-            page += 1;
-        }
-
-        Ok(all_children)
+        let url = format!("{}/lei-records/{}/direct-children?", GLEIF_API_BASE, lei);
+        self.fetch_listing(&url, "direct-children", i32::MAX, None)
+            .await
     }
 
     /// Fetch BIC mappings for an entity
     pub(crate) async fn get_bic_mappings(&self, lei: &str) -> Result<Vec<BicMapping>> {
-        self.rate_limit().await;
         let url = format!("{}/lei-records/{}/bics", GLEIF_API_BASE, lei);
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.send_get(&url).await?;
 
         if response.status() == reqwest::StatusCode::NOT_FOUND {
             return Ok(vec![]);
@@ -644,115 +789,152 @@ impl GleifClient {
     /// Fetch all funds managed by a given fund manager LEI
     /// Uses the GLEIF relationship endpoint: /{manager_lei}/managed-funds
     pub(crate) async fn get_managed_funds(&self, manager_lei: &str) -> Result<Vec<LeiRecord>> {
-        let mut all_funds = Vec::new();
-        let mut page = 1;
-        let page_size = 100;
+        let url = managed_funds_url(manager_lei);
+        self.fetch_listing(&url, "managed-funds", MAX_MANAGED_FUND_PAGES, None)
+            .await
+    }
 
-        loop {
-            self.rate_limit().await;
-            // Use the managed-funds relationship endpoint (correct GLEIF API path)
-            let url = format!(
-                "{}/lei-records/{}/managed-funds?page%5Bnumber%5D={}&page%5Bsize%5D={}",
-                GLEIF_API_BASE, manager_lei, page, page_size
-            );
+    /// Fetch at most `limit` funds managed by a fund manager LEI
+    ///
+    /// Only the pages needed to cover `limit` are requested.
+    pub(crate) async fn get_managed_funds_limited(
+        &self,
+        manager_lei: &str,
+        limit: usize,
+    ) -> Result<Vec<LeiRecord>> {
+        let url = managed_funds_url(manager_lei);
+        self.fetch_listing(&url, "managed-funds", MAX_MANAGED_FUND_PAGES, Some(limit))
+            .await
+    }
 
-            let response = self.client.get(&url).send().await?;
+    /// Fetch every page of a paginated LEI-record listing
+    ///
+    /// `query_url` is the listing URL up to (and ending in the `?` or `&`
+    /// before) the page parameters - direct-children, managed-funds and the
+    /// fund name search all page the same way. `what` names the listing in
+    /// logs and errors.
+    ///
+    /// Page 1 reports the last page number, so the remaining pages are requested
+    /// concurrently (still paced by the shared rate limiter) instead of one round
+    /// trip after another. Pages are consumed in order and the walk stops at the
+    /// first short page, or once `limit` records are in hand.
+    async fn fetch_listing(
+        &self,
+        query_url: &str,
+        what: &str,
+        max_pages: i32,
+        limit: Option<usize>,
+    ) -> Result<Vec<LeiRecord>> {
+        // Small limits fit in one short page
+        let page_size = limit.map_or(LISTING_PAGE_SIZE, |l| l.clamp(1, LISTING_PAGE_SIZE));
+
+        // 404 means an empty listing (e.g. no children), which is fine
+        let Some(first) = self
+            .fetch_listing_page(query_url, what, 1, page_size)
+            .await?
+        else {
+            return Ok(Vec::new());
+        };
 
-            if !response.status().is_success() {
-                let status = response.status();
-                let body = response.text().await.unwrap_or_default();
-                return Err(anyhow::anyhow!(
-                    "GLEIF API error {}: {}",
-                    status,
-                    body.chars().take(200).collect::<String>()
-                ));
-            }
+        let reported_last_page = first
+            .meta
+            .as_ref()
+            .and_then(|meta| meta.pagination.as_ref())
+            .map(|pagination| pagination.last_page);
+        let mut records = first.data;
+        let limit_reached = |records: &Vec<LeiRecord>| limit.is_some_and(|l| records.len() >= l);
+        if records.len() < page_size || limit_reached(&records) {
+            records.truncate(limit.unwrap_or(usize::MAX));
+            cache_lei_records(&records);
+            return Ok(records);
+        }
 
-            let text = response.text().await?;
-            let data: GleifResponse<Vec<LeiRecord>> =
-                serde_json::from_str(&text).with_context(|| {
-                    // Try to identify specific parse failures
-                    let err_msg = match serde_json::from_str::<serde_json::Value>(&text) {
-                        Ok(value) => {
-                            let mut record_errors = Vec::new();
-                            if let Some(data) = value.get("data").and_then(|d| d.as_array()) {
-                                for (i, record) in data.iter().enumerate() {
-                                    if let Err(e) =
-                                        serde_json::from_value::<LeiRecord>(record.clone())
-                                    {
-                                        record_errors.push(format!(
-                                            "Record {} error: {} (lei: {})",
-                                            i,
-                                            e,
-                                            record
-                                                .get("id")
-                                                .and_then(|v| v.as_str())
-                                                .unwrap_or("?")
-                                        ));
-                                        if record_errors.len() >= 3 {
-                                            break;
-                                        }
-                                    }
-                                }
-                            }
-                            if record_errors.is_empty() {
-                                "Unknown parse error".to_string()
-                            } else {
-                                record_errors.join("; ")
-                            }
-                        }
-                        Err(e) => format!("Invalid JSON: {}", e),
-                    };
-                    format!(
-                        "Failed to parse managed funds response. {}. First 500 chars: {}",
-                        err_msg,
-                        &text[..text.len().min(500)]
-                    )
-                })?;
-
-            let count = data.data.len();
-            all_funds.extend(data.data);
+        // Pages needed to cover `limit`
+        let wanted_pages = limit.map_or(i32::MAX, |l| {
+            i32::try_from(l.div_ceil(page_size)).unwrap_or(i32::MAX)
+        });
+        let last_page = reported_last_page.unwrap_or(max_pages);
+        if last_page > max_pages && wanted_pages > max_pages {
+            tracing::warn!(
+                "Reached max pages ({}) fetching {} ({})",
+                max_pages,
+                what,
+                query_url
+            );
+        }
+
+        let mut pages = stream::iter(2..=last_page.min(max_pages).min(wanted_pages))
+            .map(|page| self.fetch_listing_page(query_url, what, page, page_size))
+            .buffered(PAGE_FETCH_CONCURRENCY);
+
+        while let Some(page) = pages.next().await {
+            let Some(page) = page? else {
+                break;
+            };
+            let count = page.data.len();
+            records.extend(page.data);
 
             tracing::debug!(
-                "Fetched page {} with {} funds (total: {})",
-                page,
+                "Fetched {} page with {} records (total: {})",
+                what,
                 count,
-                all_funds.len()
+                records.len()
             );
 
-            // Check if there are more pages
-            if count < page_size {
+            if count < page_size || limit_reached(&records) {
                 break;
             }
+        }
 
-            // Check pagination info
-            if let Some(ref meta) = data.meta {
-                if let Some(ref pagination) = meta.pagination {
-                    if page >= pagination.last_page {
-                        break;
-                    }
-                }
-            }
+        records.truncate(limit.unwrap_or(usize::MAX));
+        cache_lei_records(&records);
+        Ok(records)
+    }
+
+    /// Fetch one page of a listing; `None` when GLEIF answers 404
+    async fn fetch_listing_page(
+        &self,
+        query_url: &str,
+        what: &str,
+        page: i32,
+        page_size: usize,
+    ) -> Result<Option<GleifResponse<Vec<LeiRecord>>>> {
+        let url = format!(
+            "{}page%5Bnumber%5D={}&page%5Bsize%5D={}",
+            query_url, page, page_size
+        );
 
-            page += 1;
+        let response = self.send_get(&url).await?;
 
-            // Safety limit to prevent infinite loops
-            if page > 50 {
-                tracing::warn!(
-                    "Reached max pages (50) fetching managed funds for {}",
-                    manager_lei
-                );
-                break;
+        if !response.status().is_success() {
+            if response.status() == StatusCode::NOT_FOUND {
+                return Ok(None);
             }
+            let status = response.status();
+            let body = response.text().await.unwrap_or_default();
+            return Err(anyhow::anyhow!(
+                "GLEIF API error {}: {}",
+                status,
+                body.chars().take(200).collect::<String>()
+            ));
         }
 
-        Ok(all_funds)
+        let body = response.bytes().await?;
+        let data: GleifResponse<Vec<LeiRecord>> =
+            serde_json::from_slice(&body).with_context(|| {
+                format!(
+                    "Failed to parse {} response. {}. First 500 chars: {}",
+                    what,
+                    describe_record_errors(&body),
+                    body_preview(&body)
+                )
+            })?;
+
+        Ok(Some(data))
     }
 
     /// Fetch umbrella fund for a sub-fund (IS_SUBFUND_OF relationship)
     pub(crate) async fn get_umbrella_fund(&self, lei: &str) -> Result<Option<LeiRecord>> {
-        self.rate_limit().await;
-
         // First get the fund's relationships to find umbrella
         let record = self.get_lei_record(lei).await?;
 
@@ -771,8 +953,6 @@ impl GleifClient {
 
     /// Fetch fund manager for a fund (IS_FUND-MANAGED_BY relationship)
     pub(crate) async fn get_fund_manager(&self, lei: &str) -> Result<Option<LeiRecord>> {
-        self.rate_limit().await;
-
         let record = self.get_lei_record(lei).await?;
 
         if let Some(ref rels) = record.relationships {
@@ -790,8 +970,6 @@ impl GleifClient {
 
     /// Fetch master fund for a feeder fund (IS_FEEDER_TO relationship)
     pub(crate) async fn get_master_fund(&self, lei: &str) -> Result<Option<LeiRecord>> {
-        self.rate_limit().await;
-
         let record = self.get_lei_record(lei).await?;
 
         if let Some(ref rels) = record.relationships {
@@ -809,12 +987,10 @@ impl GleifClient {
 
     /// Look up LEI by ISIN (uses GLEIF ISIN-LEI mapping endpoint)
     pub(crate) async fn lookup_by_isin(&self, isin: &str) -> Result<Option<LeiRecord>> {
-        self.rate_limit().await;
-
         // GLEIF provides ISIN-LEI mappings via the lei-records endpoint with filter
         let url = format!("{}/lei-records?filter[isin]={}", GLEIF_API_BASE, isin);
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.send_get(&url).await?;
 
         if !response.status().is_success() {
             if response.status() == reqwest::StatusCode::NOT_FOUND {
@@ -827,9 +1003,9 @@ impl GleifClient {
             ));
         }
 
-        let text = response.text().await?;
+        let body = response.bytes().await?;
         let data: GleifResponse<Vec<LeiRecord>> =
-            serde_json::from_str(&text).context("Failed to parse ISIN lookup response")?;
+            serde_json::from_slice(&body).context("Failed to parse ISIN lookup response")?;
 
         // Return the first matching record
         Ok(data.data.into_iter().next())
@@ -842,98 +1018,68 @@ impl GleifClient {
         name_pattern: &str,
         limit: usize,
     ) -> Result<Vec<LeiRecord>> {
-        let mut all_funds = Vec::new();
-        let mut page = 1;
-        let page_size = 100.min(limit);
-
-        loop {
-            self.rate_limit().await;
-
-            // Search for entities with FUND category and name pattern
-            // Use wildcard search with the name pattern
-            // URL-encode the name pattern (spaces -> %20, & -> %26)
-            let encoded_name = name_pattern
-                .replace(' ', "%20")
-                .replace('&', "%26")
-                .replace('+', "%2B");
-            let url = format!(
-                "{}/lei-records?filter%5Bentity.legalName%5D={}*&filter%5Bentity.category%5D=FUND&page%5Bnumber%5D={}&page%5Bsize%5D={}",
-                GLEIF_API_BASE,
-                encoded_name,
-                page,
-                page_size
-            );
-
-            let response = self.client.get(&url).send().await?;
-
-            if !response.status().is_success() {
-                let status = response.status();
-                let body = response.text().await.unwrap_or_default();
-                return Err(anyhow::anyhow!(
-                    "GLEIF API error {}: {}",
-                    status,
-                    body.chars().take(200).collect::<String>()
-                ));
-            }
-
-            let text = response.text().await?;
-            let data: GleifResponse<Vec<LeiRecord>> =
-                serde_json::from_str(&text).with_context(|| {
-                    format!(
-                        "Failed to parse fund search response. First 500 chars: {}",
-                        &text[..text.len().min(500)]
-                    )
-                })?;
+        // Wildcard search on the name pattern, restricted to the FUND category
+        // URL-encode the name pattern (spaces -> %20, & -> %26)
+        let encoded_name = name_pattern
+            .replace(' ', "%20")
+            .replace('&', "%26")
+            .replace('+', "%2B");
+        let url = format!(
+            "{}/lei-records?filter%5Bentity.legalName%5D={}*&filter%5Bentity.category%5D=FUND&",
+            GLEIF_API_BASE, encoded_name
+        );
 
-            let count = data.data.len();
-            all_funds.extend(data.data);
+        self.fetch_listing(&url, "fund search", MAX_FUND_SEARCH_PAGES, Some(limit))
+            .await
+    }
+}
 
-            tracing::debug!(
-                "Fetched page {} with {} funds (total: {})",
-                page,
-                count,
-                all_funds.len()
-            );
+impl Default for GleifClient {
+    fn default() -> Self {
+        Self::new().expect("Failed to create default GLEIF client")
+    }
+}
 
-            // Check if we've hit the limit
-            if all_funds.len() >= limit {
-                all_funds.truncate(limit);
-                break;
-            }
+/// Listing URL for the funds a manager LEI manages
+fn managed_funds_url(manager_lei: &str) -> String {
+    format!(
+        "{}/lei-records/{}/managed-funds?",
+        GLEIF_API_BASE, manager_lei
+    )
+}
 
-            // Check if there are more pages
-            if count < page_size {
-                break;
-            }
+/// Lossy UTF-8 view of the start of a response body, for error messages only
+fn body_preview(body: &[u8]) -> Cow<'_, str> {
+    String::from_utf8_lossy(&body[..body.len().min(500)])
+}
 
-            // Check pagination info
-            if let Some(ref meta) = data.meta {
-                if let Some(ref pagination) = meta.pagination {
-                    if page >= pagination.last_page {
-                        break;
+/// Pinpoint which records in a listing page failed to deserialize
+fn describe_record_errors(body: &[u8]) -> String {
+    match serde_json::from_slice::<serde_json::Value>(body) {
+        Ok(value) => {
+            let mut record_errors = Vec::new();
+            if let Some(data) = value.get("data").and_then(|d| d.as_array()) {
+                for (i, record) in data.iter().enumerate() {
+                    if let Err(e) = serde_json::from_value::<LeiRecord>(record.clone()) {
+                        record_errors.push(format!(
+                            "Record {} error: {} (lei: {})",
+                            i,
+                            e,
+                            record.get("id").and_then(|v| v.as_str()).unwrap_or("?")
+                        ));
+                        if record_errors.len() >= 3 {
+                            break;
+                        }
                     }
                 }
             }
-
-            page += 1;
-
-            // Safety limit
-            if page > 20 {
-                tracing::warn!(
-                    "Reached max pages (20) searching funds by name pattern {}",
-                    name_pattern
-                );
-                break;
+            if record_errors.is_empty() {
+                "Unknown parse error".to_string()
+            } else {
+                record_errors.join("; ")
             }
         }
-
-        Ok(all_funds)
-    }
-}
-
-impl Default for GleifClient {
-    fn default() -> Self {
-        Self::new().expect("Failed to create default GLEIF client")
+        Err(e) => format!("Invalid JSON: {}", e),
     }
 }
 
@@ -946,6 +1092,53 @@ pub(crate) fn extract_lei_from_url(url: &str) -> Option<String> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_rate_limiter_spaces_reservations() {
+        let mut limiter = RateLimiter::new();
+        let now = limiter.next_request;
+        let spacing = Duration::from_millis(RATE_LIMIT_DELAY_MS);
+
+        assert_eq!(limiter.reserve(now), Duration::ZERO);
+        assert_eq!(limiter.reserve(now), spacing);
+        assert_eq!(limiter.reserve(now), spacing * 2);
+    }
+
+    #[test]
+    fn test_rate_limiter_backs_off_and_recovers() {
+        let mut limiter = RateLimiter::new();
+        let now = limiter.next_request;
+        let base = Duration::from_millis(RATE_LIMIT_DELAY_MS);
+
+        limiter.on_throttled(now, Some(Duration::from_secs(3)));
+        assert_eq!(limiter.spacing, base * 2);
+        assert_eq!(limiter.reserve(now), Duration::from_secs(3));
+
+        for _ in 0..100 {
+            limiter.on_throttled(now, None);
+        }
+        assert_eq!(
+            limiter.spacing,
+            Duration::from_millis(RATE_LIMIT_MAX_DELAY_MS)
+        );
+
+        for _ in 0..1_000 {
+            limiter.on_success();
+        }
+        assert_eq!(limiter.spacing, base);
+    }
+
+    #[test]
+    fn test_retry_backoff_is_jittered_exponential() {
+        for attempt in 1..=3 {
+            let ceiling = Duration::from_millis(RETRY_BASE_DELAY_MS << (attempt - 1));
+            let delay = retry_backoff(attempt);
+            assert!(delay >= ceiling / 2 && delay <= ceiling, "{delay:?}");
+        }
+        assert!(is_retryable_status(StatusCode::TOO_MANY_REQUESTS));
+        assert!(is_retryable_status(StatusCode::BAD_GATEWAY));
+        assert!(!is_retryable_status(StatusCode::NOT_FOUND));
+    }
+
     #[test]
     fn test_extract_lei_from_url() {
         assert_eq!(
@@ -62,33 +62,24 @@ impl GleifEnrichmentService {
 
         let bics = self.client.get_bic_mappings(lei).await.unwrap_or_default();
 
-        let direct_parent = match self.client.get_direct_parent(lei).await {
-            Ok(Some(rel)) => {
-                let parent_lei = rel.attributes.relationship.end_node.id.clone();
-                let parent_name = self
-                    .client
-                    .get_lei_record(&parent_lei)
+        // The record already shows whether a parent is reported; only probe the
+        // relationship endpoints when one may exist, and resolve both together
+        let (direct_parent, ultimate_parent) = tokio::join!(
+            async {
+                if !record.may_have_direct_parent() {
+                    return None;
+                }
+                self.resolve_parent(self.client.get_direct_parent(lei).await)
                     .await
-                    .ok()
-                    .map(|r| r.attributes.entity.legal_name.name.clone());
-                Some((parent_lei, parent_name))
-            }
-            _ => None,
-        };
-
-        let ultimate_parent = match self.client.get_ultimate_parent(lei).await {
-            Ok(Some(rel)) => {
-                let parent_lei = rel.attributes.relationship.end_node.id.clone();
-                let parent_name = self
-                    .client
-                    .get_lei_record(&parent_lei)
+            },
+            async {
+                if !record.may_have_ultimate_parent() {
+                    return None;
+                }
+                self.resolve_parent(self.client.get_ultimate_parent(lei).await)
                     .await
-                    .ok()
-                    .map(|r| r.attributes.entity.legal_name.name.clone());
-                Some((parent_lei, parent_name))
-            }
-            _ => None,
-        };
+            },
+        );
 
         let fund_manager = match self.client.get_fund_manager(lei).await {
             Ok(Some(manager)) => manager.attributes.lei.clone().map(|manager_lei| {
@@ -128,6 +119,22 @@ impl GleifEnrichmentService {
         })
     }
 
+    /// Resolve a parent relationship lookup to (parent_lei, parent_name)
+    async fn resolve_parent(
+        &self,
+        relationship: Result<Option<RelationshipRecord>>,
+    ) -> Option<(String, Option<String>)> {
+        let rel = relationship.ok().flatten()?;
+        let parent_lei = rel.attributes.relationship.end_node.id;
+        let parent_name = self
+            .client
+            .get_lei_record(&parent_lei)
+            .await
+            .ok()
+            .map(|r| r.attributes.entity.legal_name.name);
+        Some((parent_lei, parent_name))
+    }
+
     /// Legacy method — kept for backwards compat. Calls fetch + persist
     /// internally. Callers can migrate to the split methods as needed;
     /// under the new `GleifEnrich::pre_fetch` / `execute` flow the
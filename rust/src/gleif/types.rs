@@ -410,6 +410,24 @@ impl LeiRecord {
     pub(crate) fn jurisdiction(&self) -> Option<&str> {
         self.attributes.entity.jurisdiction.as_deref()
     }
+
+    /// False when the record itself shows there is no direct parent to fetch
+    pub(crate) fn may_have_direct_parent(&self) -> bool {
+        !self
+            .relationships
+            .as_ref()
+            .and_then(|rels| rels.direct_parent.as_ref())
+            .is_some_and(RelationshipLink::is_reporting_exception_only)
+    }
+
+    /// False when the record itself shows there is no ultimate parent to fetch
+    pub(crate) fn may_have_ultimate_parent(&self) -> bool {
+        !self
+            .relationships
+            .as_ref()
+            .and_then(|rels| rels.ultimate_parent.as_ref())
+            .is_some_and(RelationshipLink::is_reporting_exception_only)
+    }
 }
 
 #[derive(Debug, Clone, Deserialize, Serialize)]
@@ -641,6 +659,14 @@ pub(crate) struct RelationshipLink {
     pub links: RelationshipLinkData,
 }
 
+impl RelationshipLink {
+    /// GLEIF marks a parent that is not reported with a link carrying only a
+    /// `reporting-exception` - the relationship endpoint would just 404
+    pub(crate) fn is_reporting_exception_only(&self) -> bool {
+        self.links.reporting_exception.is_some() && self.links.relationship_record.is_none()
+    }
+}
+
 #[derive(Debug, Clone, Deserialize, Serialize)]
 pub(crate) struct RelationshipLinkData {
     #[serde(default)]
@@ -920,22 +946,23 @@ pub(crate) struct DiscoveredEntity {
     pub legal_form_id: Option<String>,
 }
 
-impl DiscoveredEntity {
-    pub(crate) fn from_lei_record(record: &LeiRecord) -> Self {
+/// Project a full LEI record down to the fields verbs report
+///
+/// Takes the record by value so the kept strings are moved rather than cloned
+/// and the rest of the record (addresses, other names, registration, links)
+/// is freed as soon as it is projected.
+impl From<LeiRecord> for DiscoveredEntity {
+    fn from(record: LeiRecord) -> Self {
+        let entity = record.attributes.entity;
         Self {
-            lei: record.lei().to_string(),
-            name: record.attributes.entity.legal_name.name.clone(),
-            jurisdiction: record.attributes.entity.jurisdiction.clone(),
-            category: record.attributes.entity.category.clone(),
-            status: record.attributes.entity.status.clone(),
+            lei: record.attributes.lei.unwrap_or(record.id),
+            name: entity.legal_name.name,
+            jurisdiction: entity.jurisdiction,
+            category: entity.category,
+            status: entity.status,
             direct_parent_lei: None,
             ultimate_parent_lei: None,
-            legal_form_id: record
-                .attributes
-                .entity
-                .legal_form
-                .as_ref()
-                .and_then(|lf| lf.id.clone()),
+            legal_form_id: entity.legal_form.and_then(|lf| lf.id),
         }
     }
 }
@@ -28,13 +28,12 @@ use ob_poc::dsl_v2::execution::{DslExecutor, ExecutionContext, ExecutionResult};
 use ob_poc::dsl_v2::planning::compile;
 use ob_poc::dsl_v2::syntax::parse_program;
 
+use crate::gleif_test::ALLIANZ_GI_LEI;
+
 // =============================================================================
 // Configuration Constants
 // =============================================================================
 
-/// Allianz Global Investors GmbH LEI (fund manager)
-pub(crate) const ALLIANZ_GI_LEI: &str = "529900FAHFDMSXCPII15";
-
 /// Jurisdictions to filter for (Luxembourg focus)
 pub(crate) const TARGET_JURISDICTIONS: &[&str] = &["LU", "DE", "IE"];
 
@@ -114,6 +114,11 @@ const CANONICAL_NAMES: &[&str] = &[
 /// from the `rust/` working directory (xtask default).
 const SCAN_ROOTS: &[&str] = &["crates", "src"];
 
+/// Directory names the walk never descends into. Matching on the name
+/// (rather than a `/target/` path fragment) prunes the directory itself,
+/// not just its children.
+const PRUNED_DIR_NAMES: &[&str] = &["target", "node_modules", ".git"];
+
 /// Run the schema-authority audit.
 ///
 /// Returns `Ok(())` on clean / blessed runs; `Err` if drift was
@@ -187,12 +192,15 @@ fn walk(dir: &Path, matcher: &Regex, entries: &mut BTreeSet<String>) -> Result<(
         let path = child.path();
         let kind = child.file_type()?;
         if kind.is_dir() {
-            // Skip the canonical crate, target dirs, and node_modules
-            // (defensive — none should exist under SCAN_ROOTS).
-            let lossy = path.to_string_lossy();
-            if lossy.contains(CANONICAL_CRATE_PATH_FRAGMENT)
-                || lossy.contains("/target/")
-                || lossy.contains("/node_modules/")
+            // Prune build output and vendored trees by name before
+            // descending, so none of their entries are ever listed.
+            // Skip the canonical crate as well.
+            if PRUNED_DIR_NAMES
+                .iter()
+                .any(|name| child.file_name() == *name)
+                || path
+                    .to_string_lossy()
+                    .contains(CANONICAL_CRATE_PATH_FRAGMENT)
             {
                 continue;
             }
@@ -213,36 +221,50 @@ fn walk(dir: &Path, matcher: &Regex, entries: &mut BTreeSet<String>) -> Result<(
 fn scan_file(path: &Path, matcher: &Regex, entries: &mut BTreeSet<String>) -> Result<()> {
     let source = fs::read_to_string(path)
         .with_context(|| format!("reading source file {}", path.display()))?;
-    for (line_idx, line) in source.lines().enumerate() {
-        let trimmed = line.trim();
-        if !trimmed.starts_with("pub ") {
-            continue;
-        }
-        if let Some(captures) = matcher.captures(trimmed) {
-            let name = captures
-                .get(1)
-                .expect("name capture is always present when match")
-                .as_str()
-                .to_string();
-            let relative = path
-                .strip_prefix(".")
-                .unwrap_or(path)
-                .to_string_lossy()
-                .replace(std::path::MAIN_SEPARATOR, "/");
-            entries.insert(format!("{relative}:{}:{name}", line_idx + 1));
-        }
+    // One multi-line pass over the whole buffer; line numbers are counted
+    // incrementally between matches, so files with no hits (nearly all of
+    // them) never get split into lines at all.
+    let mut matches = matcher.captures_iter(&source).peekable();
+    if matches.peek().is_none() {
+        return Ok(());
+    }
+    let relative = path
+        .strip_prefix(".")
+        .unwrap_or(path)
+        .to_string_lossy()
+        .replace(std::path::MAIN_SEPARATOR, "/");
+    let mut line_no = 1;
+    let mut counted_to = 0;
+    for captures in matches {
+        let start = captures
+            .get(0)
+            .expect("whole match is always present")
+            .start();
+        line_no += source.as_bytes()[counted_to..start]
+            .iter()
+            .filter(|&&byte| byte == b'\n')
+            .count();
+        counted_to = start;
+        let name = captures
+            .get(1)
+            .expect("name capture is always present when match")
+            .as_str();
+        entries.insert(format!("{relative}:{line_no}:{name}"));
     }
     Ok(())
 }
 
-/// Builds a regex of the form
-/// `^pub (struct|enum) (Name1|Name2|...)\b` matching the canonical
+/// Builds a multi-line regex of the form
+/// `^<indent>pub (struct|enum) (Name1|Name2|...)\b` matching the canonical
 /// names with a word boundary so e.g. `GraphNodeInput` doesn't fire
-/// when scanning for `GraphNode`.
+/// when scanning for `GraphNode`. Whitespace classes exclude `\n` so a
+/// match never spans lines.
 fn build_matcher() -> Regex {
     let alternation = CANONICAL_NAMES.join("|");
-    Regex::new(&format!(r"^pub\s+(?:struct|enum)\s+({alternation})\b"))
-        .expect("regex over hand-curated names should compile")
+    Regex::new(&format!(
+        r"(?m)^[^\S\n]*pub [^\S\n]*(?:struct|enum)[^\S\n]+({alternation})\b"
+    ))
+    .expect("regex over hand-curated names should compile")
 }
 
 fn read_allowlist(path: &Path) -> Result<BTreeSet<String>> {
@@ -277,6 +299,10 @@ fn write_allowlist(path: &Path, items: &BTreeSet<String>) -> Result<()> {
         buf.push_str(entry);
         buf.push('\n');
     }
+    // A no-op bless leaves the file (and its mtime) untouched.
+    if fs::read_to_string(path).is_ok_and(|existing| existing == buf) {
+        return Ok(());
+    }
     fs::write(path, buf).with_context(|| format!("writing drift allowlist {}", path.display()))?;
     Ok(())
 }
@@ -361,6 +387,19 @@ mod tests {
         assert_eq!(round_tripped, items);
     }
 
+    #[test]
+    fn rewriting_identical_allowlist_leaves_file_untouched() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("allowlist.txt");
+        let mut items = BTreeSet::new();
+        items.insert("crates/some/src/foo.rs:42:GraphNode".to_string());
+        write_allowlist(&path, &items).unwrap();
+        let before = fs::metadata(&path).unwrap().modified().unwrap();
+        std::thread::sleep(std::time::Duration::from_millis(20));
+        write_allowlist(&path, &items).unwrap();
+        assert_eq!(fs::metadata(&path).unwrap().modified().unwrap(), before);
+    }
+
     #[test]
     fn drift_collected_from_synthetic_tree() {
         // Build a temp tree with one fake crate containing a parallel
@@ -381,4 +420,17 @@ mod tests {
             "expected GraphNode to be reported, got: {observed:?}"
         );
     }
+
+    #[test]
+    fn collect_drift_prunes_build_output() {
+        let tmp = TempDir::new().unwrap();
+        let target_dir = tmp.path().join("crates/sample/target");
+        fs::create_dir_all(&target_dir).unwrap();
+        fs::write(target_dir.join("out.rs"), "pub struct GraphNode {}\n").unwrap();
+        let observed = collect_drift(tmp.path()).unwrap();
+        assert!(
+            observed.is_empty(),
+            "target/ should not be scanned, got: {observed:?}"
+        );
+    }
 }
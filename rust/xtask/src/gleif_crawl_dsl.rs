@@ -22,8 +22,7 @@ use std::fs;
 use std::path::PathBuf;
 use std::time::Instant;
 
-/// Allianz Global Investors GmbH - Fund manager with managed funds
-pub(crate) const ALLIANZ_GI_LEI: &str = "529900FAHFDMSXCPII15";
+use crate::gleif_test::ALLIANZ_GI_LEI;
 
 /// Configuration for DSL-based GLEIF crawl
 #[derive(Debug, Clone)]
@@ -201,10 +200,8 @@ impl GleifDslCrawler {
             println!("\n  [DRY RUN] DSL generated but not executed");
             println!("\n  Generated DSL:");
             println!("{}", "-".repeat(50));
-            for stmt in &self.dsl_statements {
-                println!("{}", stmt);
-                println!();
-            }
+            // One write for the whole listing rather than two per statement
+            println!("{}\n", dsl_content);
             println!("{}", "-".repeat(50));
         }
 
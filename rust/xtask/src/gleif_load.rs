@@ -5,8 +5,13 @@
 #![allow(dead_code)] // Struct fields used for JSON deserialization from GLEIF API
 
 use anyhow::{Context, Result};
+use flate2::write::GzEncoder;
+use flate2::Compression;
 use serde::Deserialize;
+use std::borrow::Cow;
 use std::collections::HashMap;
+use std::fmt::Write as _;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 
 /// Entity data from GLEIF Level 2
@@ -218,6 +223,16 @@ pub(crate) struct CorporateTreeChild {
     pub(crate) address: Option<String>,
 }
 
+/// Section rule used in generated DSL headers
+const DSL_RULE: &str =
+    ";; ============================================================================";
+
+/// Append a generated block to the DSL buffer, newline-terminated
+fn push_block(dsl: &mut String, block: &str) {
+    dsl.push_str(block);
+    dsl.push('\n');
+}
+
 /// Convert LEI to a safe DSL binding alias
 /// Uses full LEI to avoid collisions (LEIs are 20 chars, globally unique)
 fn lei_to_alias(lei: &str) -> String {
@@ -232,6 +247,20 @@ fn escape_dsl_string(s: &str) -> String {
         .replace('\r', "")
 }
 
+/// Cap a fund name at 200 bytes for DSL comments and `:name` values
+///
+/// Cuts on a char boundary so non-ASCII legal names cannot panic the slice.
+fn truncate_display_name(name: &str) -> Cow<'_, str> {
+    if name.len() <= 200 {
+        return Cow::Borrowed(name);
+    }
+    let mut end = 197;
+    while !name.is_char_boundary(end) {
+        end -= 1;
+    }
+    Cow::Owned(format!("{}...", &name[..end]))
+}
+
 /// Generate DSL for a parent entity (Allianz SE, AllianzGI)
 fn generate_parent_entity_dsl(entity: &GleifEntity) -> String {
     let alias = lei_to_alias(&entity.lei);
@@ -322,51 +351,43 @@ fn generate_fund_dsl(fund: &ManagedFund, im_alias: &str) -> String {
     let entity_alias = lei_to_alias(&fund.fund_lei);
     let cbu_alias = format!("@cbu_{}", fund.fund_lei.to_lowercase());
 
-    // Truncate name if too long
-    let name = if fund.fund_name.len() > 200 {
-        format!("{}...", &fund.fund_name[..197])
-    } else {
-        fund.fund_name.clone()
-    };
-
-    let mut lines = vec![
-        format!(";; Fund: {}", name),
-        format!(""),
-        format!(";; Step 1: Create fund entity"),
-        "(entity.ensure-limited-company".to_string(),
-        format!("    :name \"{}\"", escape_dsl_string(&name)),
-        format!("    :lei \"{}\"", fund.fund_lei),
-        format!("    :jurisdiction \"{}\"", fund.fund_jurisdiction),
-        "    :gleif-category \"FUND\"".to_string(),
-        format!("    :as {})", entity_alias),
-        format!(""),
-        format!(";; Step 2: Create CBU for fund onboarding"),
-        "(cbu.ensure".to_string(),
-        format!("    :name \"{}\"", escape_dsl_string(&name)),
-        "    :client-type \"FUND\"".to_string(),
-        format!("    :jurisdiction \"{}\"", fund.fund_jurisdiction),
-        format!("    :as {})", cbu_alias),
-        format!(""),
-        format!(";; Step 3: Assign Investment Manager role"),
-        "(cbu.assign-role".to_string(),
-        format!("    :cbu-id {}", cbu_alias),
-        format!("    :entity-id {}", im_alias),
-        "    :role \"INVESTMENT_MANAGER\")".to_string(),
-    ];
-
-    // Add ManCo role (same as IM for self-managed)
-    lines.extend(vec![
-        format!(""),
-        format!(";; Step 4: Assign ManCo role (self-managed)"),
-        "(cbu.assign-role".to_string(),
-        format!("    :cbu-id {}", cbu_alias),
-        format!("    :entity-id {}", im_alias),
-        "    :role \"MANAGEMENT_COMPANY\")".to_string(),
-    ]);
+    let name = truncate_display_name(&fund.fund_name);
+    let escaped_name = escape_dsl_string(&name);
+    let jurisdiction = &fund.fund_jurisdiction;
+    let lei = &fund.fund_lei;
 
+    // Fixed shape - one template, rendered once.
     // Note: SICAV is a fund structure type, not a role - handled via entity_funds.fund_structure_type
-
-    lines.join("\n")
+    format!(
+        r#";; Fund: {name}
+
+;; Step 1: Create fund entity
+(entity.ensure-limited-company
+    :name "{escaped_name}"
+    :lei "{lei}"
+    :jurisdiction "{jurisdiction}"
+    :gleif-category "FUND"
+    :as {entity_alias})
+
+;; Step 2: Create CBU for fund onboarding
+(cbu.ensure
+    :name "{escaped_name}"
+    :client-type "FUND"
+    :jurisdiction "{jurisdiction}"
+    :as {cbu_alias})
+
+;; Step 3: Assign Investment Manager role
+(cbu.assign-role
+    :cbu-id {cbu_alias}
+    :entity-id {im_alias}
+    :role "INVESTMENT_MANAGER")
+
+;; Step 4: Assign ManCo role (self-managed)
+(cbu.assign-role
+    :cbu-id {cbu_alias}
+    :entity-id {im_alias}
+    :role "MANAGEMENT_COMPANY")"#
+    )
 }
 
 // ============================================================================
@@ -377,12 +398,7 @@ fn generate_fund_dsl(fund: &ManagedFund, im_alias: &str) -> String {
 fn generate_complete_fund_entity_dsl(fund: &CompleteFund) -> String {
     let alias = lei_to_alias(&fund.lei);
 
-    // Truncate name if too long
-    let name = if fund.name.len() > 200 {
-        format!("{}...", &fund.name[..197])
-    } else {
-        fund.name.clone()
-    };
+    let name = truncate_display_name(&fund.name);
 
     let mut lines = vec![
         format!(";; {}", name),
@@ -410,82 +426,80 @@ fn generate_complete_fund_entity_dsl(fund: &CompleteFund) -> String {
 /// Generate DSL for a fund CBU with correct role assignments
 /// - SICAV role: Only for sub-funds, points to umbrella entity (not the fund itself!)
 /// - Ultimate Client role: Allianz SE for all funds
+///
+/// `im_alias` / `uc_alias` are the IM and ultimate-client bindings, computed
+/// once by the caller since they are the same for every fund.
 fn generate_fund_cbu_dsl(
     fund: &CompleteFund,
-    im: &EntityRef,
+    im_alias: &str,
     ultimate_client: &EntityRef,
+    uc_alias: &str,
 ) -> String {
     let entity_alias = lei_to_alias(&fund.lei);
     let cbu_alias = format!("@cbu_{}", fund.lei.to_lowercase());
-    let im_alias = lei_to_alias(&im.lei);
-    let uc_alias = lei_to_alias(&ultimate_client.lei);
-
-    // Truncate name if too long
-    let name = if fund.name.len() > 200 {
-        format!("{}...", &fund.name[..197])
-    } else {
-        fund.name.clone()
-    };
 
-    let mut lines = vec![
-        format!(";; CBU: {}", name),
-        format!(""),
-        // Create CBU
-        "(cbu.ensure".to_string(),
-        format!("    :name \"{}\"", escape_dsl_string(&name)),
-        "    :client-type \"FUND\"".to_string(),
-        format!("    :jurisdiction \"{}\"", fund.jurisdiction),
-        format!("    :as {})", cbu_alias),
-        format!(""),
-        // Asset Owner role - the fund itself
-        "(cbu.assign-role".to_string(),
-        format!("    :cbu-id {}", cbu_alias),
-        format!("    :entity-id {}", entity_alias),
-        "    :role \"ASSET_OWNER\")".to_string(),
-        format!(""),
-        // Investment Manager role - AllianzGI
-        "(cbu.assign-role".to_string(),
-        format!("    :cbu-id {}", cbu_alias),
-        format!("    :entity-id {}", im_alias),
-        "    :role \"INVESTMENT_MANAGER\")".to_string(),
-        format!(""),
-        // ManCo role - AllianzGI (self-managed)
-        "(cbu.assign-role".to_string(),
-        format!("    :cbu-id {}", cbu_alias),
-        format!("    :entity-id {}", im_alias),
-        "    :role \"MANAGEMENT_COMPANY\")".to_string(),
-    ];
+    let name = truncate_display_name(&fund.name);
+    let escaped_name = escape_dsl_string(&name);
+    let jurisdiction = &fund.jurisdiction;
+
+    // Create CBU, then Asset Owner (the fund itself), Investment Manager and
+    // ManCo (AllianzGI, self-managed) roles - fixed shape, one template
+    let mut dsl = format!(
+        r#";; CBU: {name}
+
+(cbu.ensure
+    :name "{escaped_name}"
+    :client-type "FUND"
+    :jurisdiction "{jurisdiction}"
+    :as {cbu_alias})
+
+(cbu.assign-role
+    :cbu-id {cbu_alias}
+    :entity-id {entity_alias}
+    :role "ASSET_OWNER")
+
+(cbu.assign-role
+    :cbu-id {cbu_alias}
+    :entity-id {im_alias}
+    :role "INVESTMENT_MANAGER")
+
+(cbu.assign-role
+    :cbu-id {cbu_alias}
+    :entity-id {im_alias}
+    :role "MANAGEMENT_COMPANY")"#
+    );
 
     // SICAV role - ONLY for sub-funds with umbrella, NOT for umbrellas themselves
     // The SICAV role points to the umbrella entity, not the fund itself!
     if let Some(ref umbrella_lei) = fund.umbrella_lei {
         if !fund.is_umbrella {
             let sicav_alias = lei_to_alias(umbrella_lei);
-            lines.extend(vec![
-                format!(""),
-                format!(
-                    ";; SICAV: {} (umbrella)",
-                    fund.umbrella_name.as_deref().unwrap_or("Unknown")
-                ),
-                "(cbu.assign-role".to_string(),
-                format!("    :cbu-id {}", cbu_alias),
-                format!("    :entity-id {}", sicav_alias),
-                "    :role \"SICAV\")".to_string(),
-            ]);
+            let umbrella_name = fund.umbrella_name.as_deref().unwrap_or("Unknown");
+            dsl.push_str(&format!(
+                r#"
+
+;; SICAV: {umbrella_name} (umbrella)
+(cbu.assign-role
+    :cbu-id {cbu_alias}
+    :entity-id {sicav_alias}
+    :role "SICAV")"#
+            ));
         }
     }
 
     // Ultimate Client role - Allianz SE
-    lines.extend(vec![
-        format!(""),
-        format!(";; Ultimate Client: {}", ultimate_client.name),
-        "(cbu.assign-role".to_string(),
-        format!("    :cbu-id {}", cbu_alias),
-        format!("    :entity-id {}", uc_alias),
-        "    :role \"ULTIMATE_CLIENT\")".to_string(),
-    ]);
-
-    lines.join("\n")
+    let uc_name = &ultimate_client.name;
+    dsl.push_str(&format!(
+        r#"
+
+;; Ultimate Client: {uc_name}
+(cbu.assign-role
+    :cbu-id {cbu_alias}
+    :entity-id {uc_alias}
+    :role "ULTIMATE_CLIENT")"#
+    ));
+
+    dsl
 }
 
 /// Generate full DSL from the complete funds file (allianzgi_funds_complete.json)
@@ -511,103 +525,67 @@ pub(crate) fn generate_complete_funds_dsl(
     // Track already-defined LEIs to avoid duplicates
     let mut defined_leis: HashSet<String> = HashSet::new();
 
-    // Build DSL
-    let mut dsl_parts = vec![
-        ";; ============================================================================"
-            .to_string(),
-        ";; ALLIANZ GLEIF COMPLETE FUND DATA LOAD".to_string(),
-        format!(";; Generated: {}", chrono::Utc::now().to_rfc3339()),
-        ";; Source: GLEIF API (api.gleif.org)".to_string(),
-        format!(";; Total funds: {}", funds_data.total_funds),
-        format!(";; Umbrella SICAVs: {}", funds_data.umbrella_count),
-        ";; ============================================================================"
-            .to_string(),
-        String::new(),
-    ];
+    // Build DSL - blocks are appended straight onto one output buffer
+    let mut dsl = String::new();
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; ALLIANZ GLEIF COMPLETE FUND DATA LOAD")?;
+    writeln!(dsl, ";; Generated: {}", chrono::Utc::now().to_rfc3339())?;
+    writeln!(dsl, ";; Source: GLEIF API (api.gleif.org)")?;
+    writeln!(dsl, ";; Total funds: {}", funds_data.total_funds)?;
+    writeln!(dsl, ";; Umbrella SICAVs: {}", funds_data.umbrella_count)?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
 
     // Phase 1: Parent entities from Level 2 data (Allianz SE → AllianzGI)
-    dsl_parts.extend(vec![
-        ";; ============================================================================"
-            .to_string(),
-        ";; PHASE 1: Parent Entities (Allianz SE → AllianzGI)".to_string(),
-        ";; ============================================================================"
-            .to_string(),
-        String::new(),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; PHASE 1: Parent Entities (Allianz SE → AllianzGI)")?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
 
     let allianz_se_lei = &funds_data.ultimate_client.lei;
     let allianzgi_lei = &funds_data.investment_manager.lei;
 
-    // Allianz SE
-    if let Some(allianz_se) = level2.entities.get(allianz_se_lei) {
-        dsl_parts.push(generate_parent_entity_dsl(allianz_se));
-        dsl_parts.push(String::new());
-        defined_leis.insert(allianz_se_lei.clone());
-    } else {
-        // Fallback: Create minimal entity if not in Level 2 data
-        dsl_parts.push(format!(";; {}", funds_data.ultimate_client.name));
-        dsl_parts.push("(entity.ensure-limited-company".to_string());
-        dsl_parts.push(format!(
-            "    :name \"{}\"",
-            escape_dsl_string(&funds_data.ultimate_client.name)
-        ));
-        dsl_parts.push(format!("    :lei \"{}\"", allianz_se_lei));
-        dsl_parts.push("    :jurisdiction \"DE\"".to_string());
-        dsl_parts.push(format!("    :as {})", lei_to_alias(allianz_se_lei)));
-        dsl_parts.push(String::new());
-        defined_leis.insert(allianz_se_lei.clone());
-    }
-
-    // AllianzGI
-    if let Some(allianzgi) = level2.entities.get(allianzgi_lei) {
-        dsl_parts.push(generate_parent_entity_dsl(allianzgi));
-        dsl_parts.push(String::new());
-        defined_leis.insert(allianzgi_lei.clone());
-    } else {
-        // Fallback
-        dsl_parts.push(format!(";; {}", funds_data.investment_manager.name));
-        dsl_parts.push("(entity.ensure-limited-company".to_string());
-        dsl_parts.push(format!(
-            "    :name \"{}\"",
-            escape_dsl_string(&funds_data.investment_manager.name)
-        ));
-        dsl_parts.push(format!("    :lei \"{}\"", allianzgi_lei));
-        dsl_parts.push("    :jurisdiction \"DE\"".to_string());
-        dsl_parts.push(format!("    :as {})", lei_to_alias(allianzgi_lei)));
-        dsl_parts.push(String::new());
-        defined_leis.insert(allianzgi_lei.clone());
+    // Allianz SE, then AllianzGI - one path for both, falling back to a
+    // minimal entity when the parent is not in the Level 2 data
+    for parent in [&funds_data.ultimate_client, &funds_data.investment_manager] {
+        if let Some(entity) = level2.entities.get(&parent.lei) {
+            push_block(&mut dsl, &generate_parent_entity_dsl(entity));
+        } else {
+            writeln!(dsl, ";; {}", parent.name)?;
+            writeln!(dsl, "(entity.ensure-limited-company")?;
+            writeln!(dsl, "    :name \"{}\"", escape_dsl_string(&parent.name))?;
+            writeln!(dsl, "    :lei \"{}\"", parent.lei)?;
+            writeln!(dsl, "    :jurisdiction \"DE\"")?;
+            writeln!(dsl, "    :as {})", lei_to_alias(&parent.lei))?;
+        }
+        dsl.push('\n');
+        defined_leis.insert(parent.lei.clone());
     }
 
     // Ownership relationship: Allianz SE → AllianzGI
-    dsl_parts.extend(vec![
-        ";; Ownership: Allianz SE → AllianzGI".to_string(),
-        "(ubo.add-ownership".to_string(),
-        format!("    :owner-entity-id {}", lei_to_alias(allianz_se_lei)),
-        format!("    :owned-entity-id {}", lei_to_alias(allianzgi_lei)),
-        "    :percentage 100.0".to_string(),
-        "    :ownership-type \"DIRECT\")".to_string(),
-        String::new(),
-    ]);
+    writeln!(dsl, ";; Ownership: Allianz SE → AllianzGI")?;
+    writeln!(dsl, "(ubo.add-ownership")?;
+    writeln!(dsl, "    :owner-entity-id {}", lei_to_alias(allianz_se_lei))?;
+    writeln!(dsl, "    :owned-entity-id {}", lei_to_alias(allianzgi_lei))?;
+    writeln!(dsl, "    :percentage 100.0")?;
+    writeln!(dsl, "    :ownership-type \"DIRECT\")\n")?;
 
     // Phase 2: Umbrella SICAV entities FIRST (must exist before sub-funds reference them)
     let umbrella_funds: Vec<_> = funds_data.funds.iter().filter(|f| f.is_umbrella).collect();
 
-    dsl_parts.extend(vec![
-        ";; ============================================================================"
-            .to_string(),
-        format!(
-            ";; PHASE 2: Umbrella SICAV Entities ({} umbrellas)",
-            umbrella_funds.len()
-        ),
-        ";; MUST be created before sub-funds reference them via SICAV role".to_string(),
-        ";; ============================================================================"
-            .to_string(),
-        String::new(),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(
+        dsl,
+        ";; PHASE 2: Umbrella SICAV Entities ({} umbrellas)",
+        umbrella_funds.len()
+    )?;
+    writeln!(
+        dsl,
+        ";; MUST be created before sub-funds reference them via SICAV role"
+    )?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
 
     for umbrella in &umbrella_funds {
-        dsl_parts.push(generate_complete_fund_entity_dsl(umbrella));
-        dsl_parts.push(String::new());
+        push_block(&mut dsl, &generate_complete_fund_entity_dsl(umbrella));
+        dsl.push('\n');
         defined_leis.insert(umbrella.lei.clone());
     }
 
@@ -629,40 +607,31 @@ pub(crate) fn generate_complete_funds_dsl(
     external_umbrellas.dedup_by_key(|(lei, _)| *lei);
 
     if !external_umbrellas.is_empty() {
-        dsl_parts.extend(vec![
-            ";; ============================================================================"
-                .to_string(),
-            format!(
-                ";; PHASE 2.5: External Umbrella Entities ({} external)",
-                external_umbrellas.len()
-            ),
-            ";; These umbrellas are referenced by sub-funds but not in our fund list".to_string(),
-            ";; Creating placeholder entities so SICAV role can reference them".to_string(),
-            ";; ============================================================================"
-                .to_string(),
-            String::new(),
-        ]);
+        writeln!(dsl, "{}", DSL_RULE)?;
+        writeln!(
+            dsl,
+            ";; PHASE 2.5: External Umbrella Entities ({} external)",
+            external_umbrellas.len()
+        )?;
+        writeln!(
+            dsl,
+            ";; These umbrellas are referenced by sub-funds but not in our fund list"
+        )?;
+        writeln!(
+            dsl,
+            ";; Creating placeholder entities so SICAV role can reference them"
+        )?;
+        writeln!(dsl, "{}\n", DSL_RULE)?;
 
         for (lei, name) in &external_umbrellas {
-            let alias = lei_to_alias(lei);
-            // Truncate name if too long
-            let display_name = if name.len() > 200 {
-                format!("{}...", &name[..197])
-            } else {
-                (*name).to_string()
-            };
-
-            dsl_parts.push(format!(";; External umbrella: {}", display_name));
-            dsl_parts.push("(entity.ensure-limited-company".to_string());
-            dsl_parts.push(format!(
-                "    :name \"{}\"",
-                escape_dsl_string(&display_name)
-            ));
-            dsl_parts.push(format!("    :lei \"{}\"", lei));
-            dsl_parts.push("    :jurisdiction \"LU\"".to_string()); // Default to LU for fund umbrellas
-            dsl_parts.push("    :gleif-category \"FUND\"".to_string());
-            dsl_parts.push(format!("    :as {})", alias));
-            dsl_parts.push(String::new());
+            let display_name = truncate_display_name(name);
+            writeln!(dsl, ";; External umbrella: {}", display_name)?;
+            writeln!(dsl, "(entity.ensure-limited-company")?;
+            writeln!(dsl, "    :name \"{}\"", escape_dsl_string(&display_name))?;
+            writeln!(dsl, "    :lei \"{}\"", lei)?;
+            writeln!(dsl, "    :jurisdiction \"LU\"")?; // Default to LU for fund umbrellas
+            writeln!(dsl, "    :gleif-category \"FUND\"")?;
+            writeln!(dsl, "    :as {})\n", lei_to_alias(lei))?;
             defined_leis.insert((*lei).to_string());
         }
     }
@@ -676,22 +645,18 @@ pub(crate) fn generate_complete_funds_dsl(
         remaining_funds
     };
 
-    dsl_parts.extend(vec![
-        ";; ============================================================================"
-            .to_string(),
-        format!(
-            ";; PHASE 3: Sub-Fund and Standalone Fund Entities ({})",
-            funds_to_process.len()
-        ),
-        ";; ============================================================================"
-            .to_string(),
-        String::new(),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(
+        dsl,
+        ";; PHASE 3: Sub-Fund and Standalone Fund Entities ({})",
+        funds_to_process.len()
+    )?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
 
     for fund in &funds_to_process {
         if !defined_leis.contains(&fund.lei) {
-            dsl_parts.push(generate_complete_fund_entity_dsl(fund));
-            dsl_parts.push(String::new());
+            push_block(&mut dsl, &generate_complete_fund_entity_dsl(fund));
+            dsl.push('\n');
             defined_leis.insert(fund.lei.clone());
         }
     }
@@ -712,39 +677,37 @@ pub(crate) fn generate_complete_funds_dsl(
             .collect()
     };
 
-    dsl_parts.extend(vec![
-        ";; ============================================================================"
-            .to_string(),
-        format!(
-            ";; PHASE 4: CBUs with Role Assignments ({})",
-            all_funds_for_cbus.len()
-        ),
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(
+        dsl,
+        ";; PHASE 4: CBUs with Role Assignments ({})",
+        all_funds_for_cbus.len()
+    )?;
+    writeln!(
+        dsl,
         ";; Roles: ASSET_OWNER, INVESTMENT_MANAGER, MANAGEMENT_COMPANY, SICAV*, ULTIMATE_CLIENT"
-            .to_string(),
-        ";; *SICAV only for sub-funds, points to umbrella entity (not fund itself!)".to_string(),
-        ";; ============================================================================"
-            .to_string(),
-        String::new(),
-    ]);
-
+    )?;
+    writeln!(
+        dsl,
+        ";; *SICAV only for sub-funds, points to umbrella entity (not fund itself!)"
+    )?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
+
+    let im_alias = lei_to_alias(&funds_data.investment_manager.lei);
+    let uc_alias = lei_to_alias(&funds_data.ultimate_client.lei);
     for fund in all_funds_for_cbus {
-        dsl_parts.push(generate_fund_cbu_dsl(
-            fund,
-            &funds_data.investment_manager,
-            &funds_data.ultimate_client,
-        ));
-        dsl_parts.push(String::new());
+        push_block(
+            &mut dsl,
+            &generate_fund_cbu_dsl(fund, &im_alias, &funds_data.ultimate_client, &uc_alias),
+        );
+        dsl.push('\n');
     }
 
-    dsl_parts.extend(vec![
-        ";; ============================================================================"
-            .to_string(),
-        ";; END OF ALLIANZ GLEIF COMPLETE FUND DATA LOAD".to_string(),
-        ";; ============================================================================"
-            .to_string(),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; END OF ALLIANZ GLEIF COMPLETE FUND DATA LOAD")?;
+    writeln!(dsl, "{}", DSL_RULE)?;
 
-    Ok(dsl_parts.join("\n"))
+    Ok(dsl)
 }
 
 /// Generate DSL for a corporate tree child (Allianz SE subsidiary)
@@ -826,42 +789,44 @@ pub(crate) fn generate_full_dsl(
     let corp_tree: CorporateTree = serde_json::from_str(&corp_content)
         .with_context(|| format!("Failed to parse {}", corp_tree_path.display()))?;
 
-    // Track already-defined LEIs to avoid duplicates
-    let mut defined_leis: HashSet<String> = HashSet::new();
-
-    // Build DSL
-    let mut dsl_parts = vec![
-        format!(";; ============================================================================"),
-        format!(";; ALLIANZ GLEIF DATA LOAD"),
-        format!(";; Generated: {}", chrono::Utc::now().to_rfc3339()),
-        format!(";; Source: GLEIF API (api.gleif.org)"),
-        format!(";; ============================================================================"),
-        format!(""),
-        format!(";; ============================================================================"),
-        format!(";; PHASE 1: Parent Entities (Allianz SE → AllianzGI hierarchy)"),
-        format!(";; ============================================================================"),
-        format!(""),
-    ];
-
     // Phase 1: Parent entities from Level 2 data
     // Order matters - Allianz SE first, then AllianzGI
     let allianz_se_lei = "529900K9B0N5BT694847";
     let allianzgi_lei = "OJ2TIQSVQND4IZYYK658";
-
-    if let Some(allianz_se) = level2.entities.get(allianz_se_lei) {
-        dsl_parts.push(generate_parent_entity_dsl(allianz_se));
-        dsl_parts.push(String::new());
-        defined_leis.insert(allianz_se_lei.to_string());
-    }
-
-    if let Some(allianzgi) = level2.entities.get(allianzgi_lei) {
-        dsl_parts.push(generate_parent_entity_dsl(allianzgi));
-        dsl_parts.push(String::new());
-        defined_leis.insert(allianzgi_lei.to_string());
+    let parents: Vec<&GleifEntity> = [allianz_se_lei, allianzgi_lei]
+        .iter()
+        .filter_map(|lei| level2.entities.get(*lei))
+        .collect();
+
+    // Pre-pass: every LEI defined by Phases 1-2 is known before anything is
+    // emitted, so the later phases only do set lookups
+    let defined_leis: HashSet<&str> = parents
+        .iter()
+        .map(|e| e.lei.as_str())
+        .chain(ownership.subsidiaries.iter().map(|s| s.lei.as_str()))
+        .collect();
+
+    // Build DSL - blocks are appended straight onto one output buffer
+    let mut dsl = String::new();
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; ALLIANZ GLEIF DATA LOAD")?;
+    writeln!(dsl, ";; Generated: {}", chrono::Utc::now().to_rfc3339())?;
+    writeln!(dsl, ";; Source: GLEIF API (api.gleif.org)")?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(
+        dsl,
+        ";; PHASE 1: Parent Entities (Allianz SE → AllianzGI hierarchy)"
+    )?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
+
+    for parent in &parents {
+        push_block(&mut dsl, &generate_parent_entity_dsl(parent));
+        dsl.push('\n');
     }
 
     // Phase 1b: Ownership relationships
-    dsl_parts.extend(vec![format!(";; Ownership relationships"), format!("")]);
+    writeln!(dsl, ";; Ownership relationships\n")?;
 
     for rel in &ownership.relationships {
         // Only include relationships where both entities exist
@@ -869,23 +834,19 @@ pub(crate) fn generate_full_dsl(
             || rel.parent_lei == allianz_se_lei
             || rel.parent_lei == allianzgi_lei
         {
-            dsl_parts.push(generate_ownership_dsl(rel));
-            dsl_parts.push(String::new());
+            push_block(&mut dsl, &generate_ownership_dsl(rel));
+            dsl.push('\n');
         }
     }
 
     // Phase 2: AllianzGI Subsidiaries
-    dsl_parts.extend(vec![
-        format!(";; ============================================================================"),
-        format!(";; PHASE 2: AllianzGI Subsidiaries"),
-        format!(";; ============================================================================"),
-        format!(""),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; PHASE 2: AllianzGI Subsidiaries")?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
 
     for sub in &ownership.subsidiaries {
-        dsl_parts.push(generate_subsidiary_dsl(sub));
-        dsl_parts.push(String::new());
-        defined_leis.insert(sub.lei.clone());
+        push_block(&mut dsl, &generate_subsidiary_dsl(sub));
+        dsl.push('\n');
     }
 
     // Phase 3: Managed Funds → CBUs
@@ -895,18 +856,15 @@ pub(crate) fn generate_full_dsl(
         ownership.managed_funds_sample.iter().collect()
     };
 
-    dsl_parts.extend(vec![
-        format!(";; ============================================================================"),
-        format!(";; PHASE 3: Managed Funds → CBUs with IM/ManCo roles"),
-        format!(";; Total funds: {}", funds.len()),
-        format!(";; ============================================================================"),
-        format!(""),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; PHASE 3: Managed Funds → CBUs with IM/ManCo roles")?;
+    writeln!(dsl, ";; Total funds: {}", funds.len())?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
 
     let im_alias = lei_to_alias(allianzgi_lei);
     for fund in funds {
-        dsl_parts.push(generate_fund_dsl(fund, &im_alias));
-        dsl_parts.push(String::new());
+        push_block(&mut dsl, &generate_fund_dsl(fund, &im_alias));
+        dsl.push('\n');
     }
 
     // Phase 4: Allianz SE Direct Subsidiaries
@@ -916,41 +874,56 @@ pub(crate) fn generate_full_dsl(
         corp_tree.direct_children.iter().collect()
     };
 
-    dsl_parts.extend(vec![
-        format!(";; ============================================================================"),
-        format!(";; PHASE 4: Allianz SE Direct Subsidiaries"),
-        format!(";; Total: {}", children.len()),
-        format!(";; ============================================================================"),
-        format!(""),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; PHASE 4: Allianz SE Direct Subsidiaries")?;
+    writeln!(dsl, ";; Total: {}", children.len())?;
+    writeln!(dsl, "{}\n", DSL_RULE)?;
 
     let mut skipped_count = 0;
     for child in children {
         // Skip entities already defined in earlier phases
-        if defined_leis.contains(&child.lei) {
+        if defined_leis.contains(child.lei.as_str()) {
             skipped_count += 1;
             continue;
         }
-        dsl_parts.push(generate_corp_child_dsl(child, allianz_se_lei));
-        dsl_parts.push(String::new());
+        push_block(&mut dsl, &generate_corp_child_dsl(child, allianz_se_lei));
+        dsl.push('\n');
     }
     if skipped_count > 0 {
-        dsl_parts.insert(
-            dsl_parts.len() - 3, // Before "END OF" comment
-            format!(
-                ";; Skipped {} entities already defined in earlier phases",
-                skipped_count
-            ),
-        );
+        writeln!(
+            dsl,
+            ";; Skipped {} entities already defined in earlier phases",
+            skipped_count
+        )?;
     }
 
-    dsl_parts.extend(vec![
-        format!(";; ============================================================================"),
-        format!(";; END OF ALLIANZ GLEIF DATA LOAD"),
-        format!(";; ============================================================================"),
-    ]);
+    writeln!(dsl, "{}", DSL_RULE)?;
+    writeln!(dsl, ";; END OF ALLIANZ GLEIF DATA LOAD")?;
+    writeln!(dsl, "{}", DSL_RULE)?;
+
+    Ok(dsl)
+}
+
+/// Write generated DSL to `path`, gzip-compressing when the path ends in `.gz`.
+///
+/// The generated DSL is highly repetitive (`:name`, `:jurisdiction`, aliases),
+/// so level-1 deflate shrinks it several-fold for a negligible CPU cost.
+fn write_dsl_output(path: &Path, dsl: &str) -> Result<()> {
+    let file = std::fs::File::create(path)
+        .with_context(|| format!("Failed to create {}", path.display()))?;
+    let mut writer = BufWriter::new(file);
+
+    if path.extension().is_some_and(|ext| ext == "gz") {
+        let mut encoder = GzEncoder::new(writer, Compression::fast());
+        encoder.write_all(dsl.as_bytes())?;
+        writer = encoder.finish()?;
+    } else {
+        writer.write_all(dsl.as_bytes())?;
+    }
 
-    Ok(dsl_parts.join("\n"))
+    writer
+        .flush()
+        .with_context(|| format!("Failed to write {}", path.display()))
 }
 
 /// Main entry point for the gleif-load command
@@ -1044,15 +1017,14 @@ pub(crate) async fn gleif_load(
 
     // Write DSL file
     std::fs::create_dir_all(output.parent().unwrap())?;
-    std::fs::write(&output, &dsl)?;
+    write_dsl_output(&output, &dsl)?;
     println!("Wrote DSL to: {}", output.display());
 
     if dry_run {
         println!("\nDRY RUN - DSL generated but not executed");
         println!("\nFirst 100 lines:");
-        for line in dsl.lines().take(100) {
-            println!("{}", line);
-        }
+        let preview: Vec<&str> = dsl.lines().take(100).collect();
+        println!("{}", preview.join("\n"));
         return Ok(());
     }
 
@@ -1079,3 +1051,27 @@ pub(crate) async fn gleif_load(
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_truncate_display_name() {
+        assert_eq!(
+            truncate_display_name("Allianz Europe Equity"),
+            "Allianz Europe Equity"
+        );
+
+        let ascii = "a".repeat(250);
+        assert_eq!(
+            truncate_display_name(&ascii),
+            format!("{}...", "a".repeat(197))
+        );
+
+        // 'é' is two bytes; byte 197 falls inside one
+        let accented = "é".repeat(120);
+        let truncated = truncate_display_name(&accented);
+        assert_eq!(truncated, format!("{}...", "é".repeat(98)));
+    }
+}
@@ -1061,28 +1061,24 @@ impl GleifTestHarness {
     }
 
     fn extract_entity_metadata_from_record(&mut self, record: &Value) {
-        // Category
-        if let Some(cat) = record
-            .pointer("/attributes/entity/category")
-            .and_then(|c| c.as_str())
-        {
-            self.report.entity_categories.insert(cat.to_string());
-        }
+        // Resolve the entity object once; the per-field lookups are then
+        // single-key gets. Values repeat across hundreds of fund records, so
+        // only allocate for ones not seen yet.
+        if let Some(entity) = record.pointer("/attributes/entity") {
+            // Category
+            if let Some(cat) = entity.get("category").and_then(|c| c.as_str()) {
+                insert_if_new(&mut self.report.entity_categories, cat);
+            }
 
-        // Status
-        if let Some(status) = record
-            .pointer("/attributes/entity/status")
-            .and_then(|s| s.as_str())
-        {
-            self.report.entity_statuses.insert(status.to_string());
-        }
+            // Status
+            if let Some(status) = entity.get("status").and_then(|s| s.as_str()) {
+                insert_if_new(&mut self.report.entity_statuses, status);
+            }
 
-        // Legal form
-        if let Some(legal_form) = record
-            .pointer("/attributes/entity/legalForm/id")
-            .and_then(|l| l.as_str())
-        {
-            self.report.legal_forms.insert(legal_form.to_string());
+            // Legal form
+            if let Some(legal_form) = entity.pointer("/legalForm/id").and_then(|l| l.as_str()) {
+                insert_if_new(&mut self.report.legal_forms, legal_form);
+            }
         }
 
         // Relationship types from relationships object
@@ -1233,6 +1229,13 @@ impl GleifTestHarness {
     }
 }
 
+/// Insert `value` into `set`, allocating only when it is not already present
+fn insert_if_new(set: &mut HashSet<String>, value: &str) {
+    if !set.contains(value) {
+        set.insert(value.to_string());
+    }
+}
+
 // =============================================================================
 // Public Entry Points
 // =============================================================================
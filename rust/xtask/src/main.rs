@@ -294,7 +294,7 @@ enum Command {
 
     /// Load Allianz GLEIF data from JSON files and generate/execute DSL
     GleifLoad {
-        /// Output DSL file (default: data/derived/dsl/allianz_gleif_load.dsl)
+        /// Output DSL file (default: data/derived/dsl/allianz_gleif_load.dsl; a .gz path is gzip-compressed)
         #[arg(long, short = 'o')]
         output: Option<std::path::PathBuf>,
 
@@ -2167,17 +2167,15 @@ fn project_root() -> Result<std::path::PathBuf> {
 fn check(sh: &Shell, db: bool) -> Result<()> {
     println!("Running checks...");
 
-    // Compile check (workspace)
-    println!("  Checking compilation...");
-    cmd!(sh, "cargo check --workspace").run()?;
-
     println!("  Checking public API allowlist...");
     pub_lint::run(false)?;
 
     println!("  Checking ACP envelope byte-equality (R6)...");
     acp_envelope_byte_equality::run(false)?;
 
-    // Clippy (workspace)
+    // Clippy (workspace). This is also the compile check: clippy type-checks
+    // every target `cargo check --workspace` would, and the two don't share
+    // artifacts, so a separate check pass only doubled the work.
     println!("  Running clippy...");
     if db {
         cmd!(sh, "cargo clippy --workspace --all-targets -- -D warnings").run()?;
@@ -2231,7 +2229,22 @@ fn clippy(sh: &Shell, fix: bool) -> Result<()> {
 }
 
 fn test(sh: &Shell, lib: bool, db: bool, filter: Option<String>) -> Result<()> {
-    let mut args = vec!["test"];
+    // Use cargo-nextest when it's installed: it runs every test as its own
+    // process scheduled across all cores rather than one binary at a time.
+    // It doesn't run doctests, so a full (non --lib) run picks those up
+    // with `cargo test --doc` afterwards.
+    let nextest = cmd!(sh, "cargo nextest --version")
+        .quiet()
+        .ignore_stdout()
+        .ignore_stderr()
+        .run()
+        .is_ok();
+
+    let mut args = if nextest {
+        vec!["nextest", "run"]
+    } else {
+        vec!["test"]
+    };
 
     if lib {
         args.push("--lib");
@@ -2240,15 +2253,21 @@ fn test(sh: &Shell, lib: bool, db: bool, filter: Option<String>) -> Result<()> {
     args.push("--features");
     args.push("database");
 
-    let filter_str;
-    if let Some(ref f) = filter {
-        filter_str = f.clone();
-        args.push("--");
-        args.push(&filter_str);
-    }
+    let filter_args: Vec<&str> = match filter.as_deref() {
+        // nextest takes name filters directly; libtest wants them after `--`.
+        Some(f) if nextest => vec![f],
+        Some(f) => vec!["--", f],
+        None => Vec::new(),
+    };
+    args.extend(&filter_args);
 
     cmd!(sh, "cargo {args...}").run()?;
 
+    if nextest && !lib {
+        println!("Running doctests...");
+        cmd!(sh, "cargo test --doc --features database {filter_args...}").run()?;
+    }
+
     if db {
         println!("Running database integration tests...");
         cmd!(sh, "cargo test --features database --test db_integration").run()?;
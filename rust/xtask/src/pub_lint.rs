@@ -2,7 +2,9 @@ use anyhow::{bail, Context, Result};
 use regex::Regex;
 use std::collections::BTreeSet;
 use std::fs;
+use std::io::Read;
 use std::path::{Path, PathBuf};
+use std::sync::LazyLock;
 
 const ALLOWLIST_PATH: &str = "tools/public-api-allowlist.txt";
 const SCANNED_FILES: &[&str] = &[
@@ -17,6 +19,17 @@ const SCANNED_FILES: &[&str] = &[
     "crates/ob-poc-boundary/src/acp_runtime_context.rs",
 ];
 
+/// A public item declaration at the start of a line, after indentation.
+/// Multi-line mode lets one pass over the whole file visit only the
+/// matching lines; whitespace classes are kept to `[ \t]` so a match never
+/// spans a line break.
+static PUBLIC_ITEM_RE: LazyLock<Regex> = LazyLock::new(|| {
+    Regex::new(
+        r"(?m)^[ \t]*pub[ \t]+(?:(?:async|unsafe|extern)[ \t]+)?(?:mod|use|struct|enum|trait|type|const|static|fn)\b",
+    )
+    .expect("public API regex should compile")
+});
+
 /// Run the public API allowlist check.
 ///
 /// # Examples
@@ -64,24 +77,20 @@ pub(crate) fn run(bless: bool) -> Result<()> {
 }
 
 fn collect_public_api_items(root: &Path) -> Result<BTreeSet<String>> {
-    let matcher = Regex::new(
-        r"^\s*pub\s+(?:async\s+|unsafe\s+|extern\s+)?(?:mod|use|struct|enum|trait|type|const|static|fn)\b",
-    )
-    .expect("public API regex should compile");
     let mut items = BTreeSet::new();
+    // One read buffer for every scan target, and the display path is
+    // normalized once per file rather than once per matched line.
+    let mut source = String::new();
     for relative_path in SCANNED_FILES {
         let path = root.join(relative_path);
-        let source = fs::read_to_string(&path)
+        source.clear();
+        fs::File::open(&path)
+            .and_then(|mut file| file.read_to_string(&mut source))
             .with_context(|| format!("reading public API scan target {}", path.display()))?;
-        for line in source.lines() {
-            let trimmed = line.trim();
-            if matcher.is_match(trimmed) {
-                items.insert(format!(
-                    "{}:{}",
-                    normalize_path(relative_path),
-                    normalize_public_line(trimmed)
-                ));
-            }
+        let display_path = normalize_path(relative_path);
+        for found in PUBLIC_ITEM_RE.find_iter(&source) {
+            let line = source[found.start()..].lines().next().unwrap_or_default();
+            items.insert(format!("{display_path}:{}", normalize_public_line(line)));
         }
     }
     Ok(items)
@@ -116,6 +125,10 @@ fn write_allowlist(path: &Path, items: &BTreeSet<String>) -> Result<()> {
         output.push_str(item);
         output.push('\n');
     }
+    // A no-op bless leaves the file (and its mtime) untouched.
+    if fs::read_to_string(path).is_ok_and(|existing| existing == output) {
+        return Ok(());
+    }
     fs::write(path, output)
         .with_context(|| format!("writing public API allowlist {}", path.display()))
 }
@@ -829,9 +829,13 @@ fn parse_schema_sql(
     let mut current: Option<(String, TableSchema)> = None;
 
     for line in raw.lines() {
-        if let Some(cap) = create_re.captures(line) {
-            current = Some((cap[1].to_string(), TableSchema::default()));
-            continue;
+        // `create_re` is anchored on this literal prefix; the plain prefix
+        // test keeps the regex off the vast majority of schema lines.
+        if line.starts_with("CREATE TABLE") {
+            if let Some(cap) = create_re.captures(line) {
+                current = Some((cap[1].to_string(), TableSchema::default()));
+                continue;
+            }
         }
 
         if let Some((name, table)) = current.as_mut() {